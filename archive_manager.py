@@ -17,9 +17,10 @@ from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import boto3
+from botocore.client import Config
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +30,10 @@ IST = timezone(timedelta(hours=5, minutes=30))
 # Maximum size for each archive part (1GB for easier management)
 MAX_ARCHIVE_SIZE = 1 * 1024 * 1024 * 1024  # 1GB in bytes
 
+# The one S3 client is shared by every download worker and by upload_file's
+# transfer threads; botocore's default pool of 10 connections is too small
+S3_MAX_POOL_CONNECTIONS = 50
+
 
 def format_size(size_bytes: int) -> str:
     """Convert bytes to human readable format"""
@@ -222,7 +227,13 @@ class S3ArchiveManager:
         self.s3_prefix = s3_prefix
         self.local_dir = Path(local_dir)
         self.local_only = local_only
-        self.s3 = None if local_only else boto3.client("s3")
+        self.s3 = (
+            None
+            if local_only
+            else boto3.client(
+                "s3", config=Config(max_pool_connections=S3_MAX_POOL_CONNECTIONS)
+            )
+        )
         self.max_archive_size = max_archive_size
 
         # Archive tracking - stores open tar file handles
@@ -231,6 +242,8 @@ class S3ArchiveManager:
         self.indexes: Dict[ArchiveKey, IndexFileV2] = {}
         self.current_part_files: Dict[ArchiveKey, List[str]] = defaultdict(list)
         self.current_part_size: Dict[ArchiveKey, int] = defaultdict(int)
+        # Every file name known for an archive (index parts + current part)
+        self.known_files: Dict[ArchiveKey, set] = {}
 
         self.modified_archives = set()  # Track which archives have new content
         self.lock = threading.RLock()  # Reentrant lock for nested calls
@@ -512,6 +525,8 @@ class S3ArchiveManager:
 
                 # Load existing files from the archive
                 self.current_part_files[key] = list(archive.getnames())
+                if key in self.known_files:
+                    self.known_files[key].update(self.current_part_files[key])
             else:
                 # Create new archive
                 is_first = len(index.parts) == 0
@@ -739,54 +754,97 @@ class S3ArchiveManager:
         content: bytes | str,
     ):
         """Add a file to an archive, handling size-based partitioning"""
+        self.add_many(
+            [
+                (
+                    year,
+                    state_code,
+                    district_code,
+                    complex_code,
+                    archive_type,
+                    filename,
+                    content,
+                )
+            ]
+        )
+
+    def add_many(self, entries: List[tuple]):
+        """
+        Add several files in one locked pass.
+
+        Each entry is (year, state_code, district_code, complex_code, archive_type,
+        filename, content). Each touched archive is flushed once at the end
+        rather than after every file.
+        """
         with self.lock:
-            key = (year, state_code, district_code, complex_code, archive_type)
+            touched = []
+
+            for entry in entries:
+                (
+                    year,
+                    state_code,
+                    district_code,
+                    complex_code,
+                    archive_type,
+                    filename,
+                    content,
+                ) = entry
+                key = (year, state_code, district_code, complex_code, archive_type)
+
+                # Check if file already exists in any part
+                known = self._known_files(key)
+                if filename in known:
+                    logger.debug(
+                        f"File {filename} already exists in {year}/{state_code}/{district_code}/{complex_code}/{archive_type}, skipping"
+                    )
+                    continue
 
-            # Ensure index is loaded
-            if key not in self.indexes:
-                self.indexes[key] = self._load_index_from_s3(
+                archive = self.get_archive(
                     year, state_code, district_code, complex_code, archive_type
                 )
 
-            index = self.indexes[key]
+                # Prepare the data
+                data = content if isinstance(content, bytes) else content.encode("utf-8")
 
-            # Check if file already exists in any part
-            all_existing_files = index.get_all_files()
-            if (
-                filename in all_existing_files
-                or filename in self.current_part_files[key]
-            ):
-                logger.debug(
-                    f"File {filename} already exists in {year}/{state_code}/{district_code}/{complex_code}/{archive_type}, skipping"
-                )
-                return
-
-            archive = self.get_archive(
-                year, state_code, district_code, complex_code, archive_type
-            )
+                # Create TarInfo and add file
+                info = tarfile.TarInfo(name=filename)
+                info.size = len(data)
+                archive.addfile(info, io.BytesIO(data))
+                if archive not in touched:
+                    touched.append(archive)
 
-            # Prepare the data
-            data = content if isinstance(content, bytes) else content.encode("utf-8")
+                # Track this file
+                known.add(filename)
+                self.current_part_files[key].append(filename)
+                self.current_part_size[key] += len(data)
 
-            # Create TarInfo and add file
-            info = tarfile.TarInfo(name=filename)
-            info.size = len(data)
-            archive.addfile(info, io.BytesIO(data))
+                self.modified_archives.add(key)
 
-            # Flush to disk to prevent data loss on crash
-            if hasattr(archive, 'fileobj') and archive.fileobj:
-                archive.fileobj.flush()
+                # Track newly added files for summary
+                location_key = f"{year}/{state_code}/{district_code}/{complex_code}"
+                if filename not in self.new_files_added[location_key][archive_type]:
+                    self.new_files_added[location_key][archive_type].append(filename)
 
-            # Track this file
-            self.current_part_files[key].append(filename)
-            self.current_part_size[key] += len(data)
+            # Flush to disk to prevent data loss on crash (parts rotated out
+            # above were already closed, which flushes them)
+            for archive in touched:
+                if not archive.closed and getattr(archive, "fileobj", None):
+                    archive.fileobj.flush()
 
-            self.modified_archives.add(key)
-
-            # Track newly added files for summary
-            location_key = f"{year}/{state_code}/{district_code}/{complex_code}"
-            if filename not in self.new_files_added[location_key][archive_type]:
-                self.new_files_added[location_key][archive_type].append(filename)
+    def _known_files(self, key: ArchiveKey) -> set:
+        """
+        Names in any part of an archive, built once from the index and current
+        part and kept up to date as files are added. Call with self.lock held.
+        """
+        files = self.known_files.get(key)
+        if files is None:
+            # Ensure index is loaded
+            if key not in self.indexes:
+                self.indexes[key] = self._load_index_from_s3(*key)
+            files = set(self.indexes[key].get_all_files())
+            files.update(self.current_part_files.get(key, []))
+            self.known_files[key] = files
+        return files
 
     def file_exists(
         self,
@@ -800,19 +858,25 @@ class S3ArchiveManager:
         """Check if a file exists in any archive part"""
         with self.lock:
             key = (year, state_code, district_code, complex_code, archive_type)
+            return filename in self._known_files(key)
 
-            if key not in self.indexes:
-                self.indexes[key] = self._load_index_from_s3(
-                    year, state_code, district_code, complex_code, archive_type
+    def files_exist(
+        self,
+        year: int,
+        state_code: str,
+        district_code: str,
+        complex_code: str,
+        names: List[Tuple[str, str]],
+    ) -> List[bool]:
+        """Check several (archive_type, filename) pairs under one lock acquisition"""
+        with self.lock:
+            return [
+                filename
+                in self._known_files(
+                    (year, state_code, district_code, complex_code, archive_type)
                 )
-
-            index = self.indexes[key]
-            all_files = index.get_all_files()
-
-            # Also check current part files
-            all_files.extend(self.current_part_files.get(key, []))
-
-            return filename in all_files
+                for archive_type, filename in names
+            ]
 
     def _upload_index(
         self,
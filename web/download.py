@@ -18,36 +18,45 @@ Usage:
 
 import argparse
 import concurrent.futures
+import functools
+import io
+import itertools
 import json
 import logging
+import os
 import random
 import re
 import sys
 import threading
 import time
-import traceback
 import uuid
 import warnings
-from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from html import unescape as html_unescape
 from pathlib import Path
-from typing import Dict, Generator, List, Optional
+from typing import Dict, Generator, List, Optional, Tuple
 
 import colorlog
+import lxml.etree
+import lxml.html
+import numpy as np
 import requests
 import urllib3
-from bs4 import BeautifulSoup
 from PIL import Image
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, Timeout, ChunkedEncodingError
 from tqdm import tqdm
+from urllib3.util.retry import Retry
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from archive_manager import S3ArchiveManager
-from src.captcha_solver.main import get_text
-from src.utils.court_utils import CourtComplex, load_courts_csv
-from src.gs import check_ghostscript_available, compress_pdf_if_enabled
+from src.utils.court_utils import CourtComplex, filter_courts, load_courts_csv
+from src.gs import check_ghostscript_available, compress_pdf_bytes
+from src import qpdf
 
 # Configure logging
 root_logger = logging.getLogger()
@@ -74,12 +83,23 @@ root_logger.addHandler(console_handler)
 logger = logging.getLogger(__name__)
 
 warnings.filterwarnings("ignore", message=".*pin_memory.*not supported on MPS.*")
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+# Certificate verification for every eCourts session, set once on the session
+# rather than per request. Off because the server's certificate chain has not
+# been reliably verifiable; with True, requests uses its bundled certifi CAs.
+VERIFY_TLS = False
+if not VERIFY_TLS:
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 # Check if Ghostscript is available for PDF compression
 COMPRESSION_AVAILABLE = check_ghostscript_available()
 if not COMPRESSION_AVAILABLE:
     logger.warning("PDF compression not available (Ghostscript not found)")
+# "gs" (Ghostscript /screen, downsamples images) or "qpdf" (pikepdf, lossless
+# stream recompression in-process); see set_pdf_compressor
+PDF_COMPRESSOR = "gs"
+PDF_COMPRESSOR_NAMES = {"gs": "Ghostscript", "qpdf": "qpdf/pikepdf"}
+# Ghostscript -dPDFSETTINGS preset; screen downsamples images to 72 dpi
+PDF_COMPRESSION_LEVEL = "screen"
 
 # Configuration
 BASE_URL = "https://services.ecourts.gov.in/ecourtindia_v6/"
@@ -90,15 +110,45 @@ PACKAGES_DIR = Path("./packages")
 IST = timezone(timedelta(hours=5, minutes=30))
 START_DATE = "1950-01-01"
 COMPLETED_TASKS_FILE = Path("./dc_completed_tasks.json")
+# Append-only log of completions since the last compaction into COMPLETED_TASKS_FILE
+COMPLETED_TASKS_LOG = COMPLETED_TASKS_FILE.with_suffix(".jsonl")
+# The log being folded into COMPLETED_TASKS_FILE by a running compaction
+COMPLETED_TASKS_ROTATED_LOG = COMPLETED_TASKS_FILE.with_suffix(".jsonl.old")
+COMPLETED_TASKS_COMPACT_EVERY = 500
+# Append-only log of (complex, day) and (complex, month) cells whose searches
+# came back empty
+EMPTY_CELLS_FILE = Path("./dc_empty_cells.jsonl")
+
+# securimage codes expire server-side; discard prefetched solutions older than this
+CAPTCHA_TTL_SECONDS = 60
+# Grayscale + threshold captcha images before OCR. Off until its solve rate has
+# been compared against raw images (the model was trained on colour captchas).
+CAPTCHA_BINARIZE = False
+# Attempts per captcha solve, and per search when the server rejects the captcha
+MAX_CAPTCHA_ATTEMPTS = 11
+# Reuse a pooled session's app_token without re-fetching the index page for this
+# long (well under PHP's default 24 minute session lifetime)
+SESSION_TOKEN_TTL_SECONDS = 600
+# Case status search results kept in memory (orders of one case share a lookup)
+CASE_STATUS_CACHE_SIZE = 50_000
 
 # Directories for captcha handling
-captcha_tmp_dir = Path("./captcha-tmp")
 captcha_failures_dir = Path("./captcha-failures")
-captcha_tmp_dir.mkdir(parents=True, exist_ok=True)
 captcha_failures_dir.mkdir(parents=True, exist_ok=True)
 
 # Thread lock for completed tasks file
 completed_tasks_lock = threading.Lock()
+_compaction_lock = threading.Lock()
+
+# Completed task keys, loaded once from disk and kept in memory
+_completed_tasks: Optional[set] = None
+_completed_log = None
+_saves_since_compact = 0
+
+# Known-empty cells, loaded once like the above: "state_district_complex_YYYY-MM-DD"
+# per empty day, plus "state_district_complex_YYYY-MM" once all of a month's days are
+empty_cells_lock = threading.Lock()
+_empty_cells: Optional[set] = None
 
 # Request headers
 HEADERS = {
@@ -111,41 +161,718 @@ HEADERS = {
     "X-Requested-With": "XMLHttpRequest",
 }
 
+# Precompiled patterns for the per-row / per-order parsing hot paths
+# CNR number (16 character format: XXXX############)
+_CNR_RE = re.compile(r"\b([A-Z]{4}\d{12})\b")
+# viewHistory(case_no, cino, court_code, hideparty, search_flag, state_code, dist_code, complex_code, search_by)
+_VIEW_HISTORY_RE = re.compile(
+    r"viewHistory\s*\(\s*(\d+)\s*,\s*'([^']+)'\s*,\s*(\d+)\s*,\s*'([^']*)'\s*,\s*'([^']+)'\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*'([^']+)'\s*\)"
+)
+_VS_RE = re.compile(r"(.+?)\s*vs\s*(.+)", re.IGNORECASE)
+# Parties separators, in the order they were tried before: the first kind
+# present in the cell wins. A vs form followed by a lower-case letter is part
+# of a word ("Devsingh") and skipped; one glued to names ("KUMARVsSURESH",
+# "RameshVs Suresh") still splits. A dot right after it is dropped.
+_PARTIES_SEP_RE = re.compile(
+    "|".join(
+        [rf"(.*?){sep}(?![a-z])\.?(.*)" for sep in ("Vs", "VS", "vs", "V/s", "v/s")]
+        + [r"(.*?) v (.*)", r"(.*?) V (.*)"]
+    ),
+    re.DOTALL,
+)
+# <input> tags and their attributes, for reading the hidden app_token input
+# without a full parse. Comments are stripped first, since a commented-out
+# input can precede the real one.
+_HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+_INPUT_TAG_RE = re.compile(
+    r"<input\b((?:[^>\"']|\"[^\"]*\"|'[^']*')*)>", re.IGNORECASE
+)
+_TAG_ATTR_RE = re.compile(
+    r"([^\s\"'=/>]+)(?:\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s\"'>]+)))?"
+)
+_APP_TOKEN_INPUT_XPATH = lxml.etree.XPath("//input[@name='app_token']")
+_APP_TOKEN_RE1 = re.compile(r"app_token['\"]?\s*[:=]\s*['\"]([^'\"]+)['\"]")
+_APP_TOKEN_RE2 = re.compile(r"app_token=([^&'\"]+)")
+# Order results table columns: Serial | Case Number | Parties | Order Date | Order Link
+ORDER_COLUMN_NAMES = (
+    "serial_number",
+    "case_number",
+    "parties",
+    "order_date",
+    "document_type",
+)
+
+# Case details section headings
+_PETITIONER_RE = re.compile(r"Petitioner.*Advocate", re.I)
+_RESPONDENT_RE = re.compile(r"Respondent.*Advocate", re.I)
+_ACTS_RE = re.compile(r"Under Act", re.I)
+_HISTORY_RE = re.compile(r"Case History", re.I)
+# Party name normalization for matching case status results to orders
+_VS_NORMALIZE_RE = re.compile(r"\s+v/?s\s+")
+
+# Characters not allowed in case-number based filenames (MVOP/63/2021 -> MVOP_63_2021)
+_CASE_NO_SANITIZE_RE = re.compile(r"[^\w\d.-]")
+
+
+def get_text(img: Image.Image) -> str:
+    """
+    OCR a captcha image. The solver pulls in torch and loads the ONNX model on
+    import, so it is only imported once a captcha is actually solved (not for
+    --help, --upload-local or argument errors).
+    """
+    from src.captcha_solver.main import get_text as solve
+
+    return solve(img)
+
+
+def _binarize_captcha(img: Image.Image) -> Image.Image:
+    """Grayscale the captcha and threshold it at its mean brightness"""
+    gray = np.asarray(img.convert("L"))
+    return Image.fromarray(
+        np.where(gray > gray.mean(), 255, 0).astype(np.uint8)
+    )
+
+
+# lxml parsers are not thread-safe, so each worker thread keeps and reuses its own
+_parser_tls = threading.local()
+
+
+def _html_parser() -> lxml.html.HTMLParser:
+    """Return this thread's reusable HTML parser"""
+    parser = getattr(_parser_tls, "parser", None)
+    if parser is None:
+        parser = lxml.html.HTMLParser(recover=True, huge_tree=True)
+        _parser_tls.parser = parser
+    return parser
+
+
+def _get_text(element) -> str:
+    """Concatenate stripped text nodes of an lxml element (like bs4 get_text(strip=True))"""
+    return "".join(text.strip() for text in element.itertext())
+
+
+# Order results table lookups, compiled once rather than per call
+_CASE_LIST_XPATH = lxml.etree.XPath("//table[@id='caseList']")
+_TABLES_XPATH = lxml.etree.XPath("//table")
+_ROWS_XPATH = lxml.etree.XPath(".//tr")
+_CELLS_XPATH = lxml.etree.XPath(".//td")
+
+# Case details page lookups (evaluated against the lxml tree)
+_TEXT_NODES_XPATH = lxml.etree.XPath("//text()")
+_NEAREST_DIV_XPATH = lxml.etree.XPath("ancestor-or-self::div[1]")
+_NEAREST_TABLE_XPATH = lxml.etree.XPath("ancestor-or-self::table[1]")
+_TABLE_AFTER_TEXT_XPATH = lxml.etree.XPath("(descendant::table | following::table)[1]")
+_TABLE_AFTER_TAIL_XPATH = lxml.etree.XPath("following::table[1]")
+
+
+def _find_strings(tree, patterns: tuple) -> list:
+    """
+    First text node matching each pattern, in document order (like bs4
+    find(string=...) per pattern), collected in a single walk of the text nodes.
+    """
+    found = [None] * len(patterns)
+    remaining = len(patterns)
+    for text in _TEXT_NODES_XPATH(tree):
+        for i, pattern in enumerate(patterns):
+            if found[i] is None and pattern.search(text):
+                found[i] = text
+                remaining -= 1
+        if not remaining:
+            break
+    return found
+
+
+def _string_parent(text):
+    """Element containing a text node; an element's tail text belongs to its parent"""
+    return text.getparent() if text.is_text else text.getparent().getparent()
+
+
+def _skip_space(text: str, i: int) -> int:
+    while i < len(text) and text[i].isspace():
+        i += 1
+    return i
+
+
+def _scan_display_pdf_args(text: str, i: int) -> Optional[tuple]:
+    """Scan "('a','b','c','d','e')" starting at i; only the last argument may be empty"""
+    i = _skip_space(text, i)
+    if not text.startswith("(", i):
+        return None
+    i += 1
+    args = []
+    for n in range(5):
+        i = _skip_space(text, i)
+        if not text.startswith("'", i):
+            return None
+        end = text.find("'", i + 1)
+        if end < 0 or (end == i + 1 and n < 4):
+            return None
+        args.append(text[i + 1 : end])
+        i = _skip_space(text, end + 1)
+        if not text.startswith("," if n < 4 else ")", i):
+            return None
+        i += 1
+    return tuple(args)
+
+
+def _parse_display_pdf(onclick: str) -> Optional[tuple]:
+    """
+    Extract the arguments of displayPdf('normal_v','case_val','court_code','filename','appFlag')
+    by scanning for quotes directly; the call shape is fixed, so no regex is needed.
+    """
+    start = onclick.find("displayPdf")
+    while start >= 0:
+        args = _scan_display_pdf_args(onclick, start + len("displayPdf"))
+        if args:
+            return args
+        start = onclick.find("displayPdf", start + 1)
+    return None
+
+
+def _normalize_parties(parties: str) -> str:
+    """Drop "vs" / "v/s" separators and collapse whitespace for party matching"""
+    return " ".join(_VS_NORMALIZE_RE.sub(" ", parties).split())
+
+
+def _split_parties(parties: str) -> Optional[Tuple[str, str]]:
+    """Split a parties cell into (petitioner, respondent), or None without a separator"""
+    sep_match = _PARTIES_SEP_RE.fullmatch(parties)
+    if not sep_match:
+        return None
+    # Each separator's alternative has its own (petitioner, respondent) pair
+    last = sep_match.lastindex
+    petitioner, respondent = sep_match.group(last - 1, last)
+    return petitioner.strip(), respondent.strip()
+
+
+def _first(elements: list):
+    return elements[0] if elements else None
+
+
+def _section_parent(text):
+    """Nearest div, else nearest table, around a text node"""
+    element = _string_parent(text)
+    parent = _first(_NEAREST_DIV_XPATH(element))
+    if parent is None:
+        parent = _first(_NEAREST_TABLE_XPATH(element))
+    return parent
+
+
+def _scan_cell(cell) -> tuple:
+    """Return (text, first <a>, first <button>) for a result table cell"""
+    link = button = None
+    for element in cell.iter("a", "button"):
+        if element.tag == "a":
+            if link is None:
+                link = element
+        elif button is None:
+            button = element
+        if link is not None and button is not None:
+            break
+    return _get_text(cell), link, button
+
+
+# Court complex key: (state_code, district_code, complex_code)
+ComplexKey = Tuple[str, str, str]
+
+
+@dataclass
+class SessionState:
+    """A warm HTTP session and the eCourts token bound to it"""
+
+    session: requests.Session
+    app_token: Optional[str] = None
+    session_cookie: Optional[str] = None
+    initialized_at: float = 0.0
+
+
+class SessionPool:
+    """
+    Process-wide pool of warm sessions keyed by court complex.
+
+    Sessions are leased exclusively (the captcha and app_token are bound to the
+    server-side PHP session) and returned after the task, so later tasks for the
+    same complex reuse the keep-alive connection, cookies and token. The case
+    type mapping from fillCaseType is static per complex and shared by all
+    leases for that key, as are recent case status search results.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._idle: Dict[ComplexKey, List[SessionState]] = defaultdict(list)
+        self._case_types: Dict[ComplexKey, Dict[str, str]] = {}
+        self._case_status: "OrderedDict[tuple, List[Dict]]" = OrderedDict()
+        self._pool_size = 0
+        self._local = threading.local()
+        self.set_pool_size(64)
+
+    def set_pool_size(self, maxsize: int):
+        """
+        Grow the shared connection pool to at least maxsize connections. The
+        adapter is only rebuilt when the pool grows (run() calls this once per
+        chunk), and is remounted on idle sessions; leased ones pick it up when
+        they are released.
+        """
+        # One adapter (and urllib3 connection pool) shared by every session, so
+        # a new session for another complex reuses already-open TLS connections.
+        # Cookies stay per session since they are sent as request headers.
+        if maxsize <= self._pool_size:
+            return
+        adapter = HTTPAdapter(
+            pool_connections=maxsize,
+            pool_maxsize=maxsize,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                # 503 (like 429) is left to _fetch_with_retry, which slows the
+                # shared rate limiter and honours Retry-After for every method
+                status_forcelist=[500, 502, 504],
+            ),
+        )
+        with self.lock:
+            self._adapter = adapter
+            self._pool_size = maxsize
+            for idle in self._idle.values():
+                for state in idle:
+                    state.session.mount("https://", adapter)
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers.update(HEADERS)
+        session.verify = VERIFY_TLS
+        with self.lock:
+            session.mount("https://", self._adapter)
+        return session
+
+    def pdf_session(self) -> requests.Session:
+        """
+        The calling thread's own session on the shared adapter, for PDF GETs
+        made off the task thread. It keeps no cookies between requests; callers
+        pass a snapshot of the leased session's cookies with each GET.
+        """
+        session = getattr(self._local, "pdf_session", None)
+        if session is None:
+            session = self._local.pdf_session = self._new_session()
+        with self.lock:
+            if session.get_adapter(BASE_URL) is not self._adapter:
+                session.mount("https://", self._adapter)
+        return session
+
+    def lease(self, key: ComplexKey) -> SessionState:
+        """Take an idle session for the complex, or create a new one"""
+        with self.lock:
+            idle = self._idle[key]
+            if idle:
+                return idle.pop()
+        return SessionState(session=self._new_session())
+
+    def release(self, key: ComplexKey, state: SessionState):
+        """Return a leased session to the pool for reuse"""
+        with self.lock:
+            if state.session.get_adapter(BASE_URL) is not self._adapter:
+                state.session.mount("https://", self._adapter)
+            self._idle[key].append(state)
+
+    def get_case_types(self, key: ComplexKey) -> Optional[Dict[str, str]]:
+        with self.lock:
+            return self._case_types.get(key)
+
+    def set_case_types(self, key: ComplexKey, mapping: Dict[str, str]):
+        with self.lock:
+            self._case_types[key] = mapping
+
+    def get_case_status(self, key: tuple) -> Optional[List[Dict]]:
+        with self.lock:
+            cases = self._case_status.get(key)
+            if cases is not None:
+                self._case_status.move_to_end(key)
+            return cases
+
+    def set_case_status(self, key: tuple, cases: List[Dict]):
+        with self.lock:
+            self._case_status[key] = cases
+            self._case_status.move_to_end(key)
+            if len(self._case_status) > CASE_STATUS_CACHE_SIZE:
+                self._case_status.popitem(last=False)
+
+
+session_pool = SessionPool()
+
+
+class RateLimiter:
+    """
+    Token bucket shared by all worker threads. Callers proceed immediately while
+    tokens remain and otherwise sleep just long enough for their turn. The rate
+    halves on each rate-limit response and, while requests succeed, climbs back
+    by a tenth of the maximum at most once per recover_interval seconds.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        min_rate: float = 0.1,
+        recover_interval: float = 5.0,
+    ):
+        self.lock = threading.Lock()
+        self.max_rate = rate
+        self.min_rate = min_rate
+        self.rate = rate
+        self.capacity = capacity
+        self.recover_interval = recover_interval
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._recovered_at = self._updated
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def acquire(self):
+        """Take a token, sleeping (outside the lock) until it is available"""
+        with self.lock:
+            self._refill()
+            # Reserve the token now; a negative balance queues later callers
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+    def penalize(self):
+        """Halve the rate after the server rate-limited us"""
+        with self.lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate / 2)
+            # A full interval of successes before the first step back up
+            self._recovered_at = time.monotonic()
+
+    def recover(self):
+        """Step the rate back towards its maximum after a successful request"""
+        with self.lock:
+            if self.rate >= self.max_rate:
+                return
+            now = time.monotonic()
+            if now - self._recovered_at < self.recover_interval:
+                return
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+            self._recovered_at = now
+
+
+# Paces session initialization (the index page GET is what trips the 405
+# security page) across all threads
+init_rate_limiter = RateLimiter(rate=2.0, capacity=5)
+# Paces every request to the eCourts host. Loose enough not to bind in normal
+# runs; it only slows down after 429/503 responses, then recovers.
+request_rate_limiter = RateLimiter(rate=20.0, capacity=20)
+# Longest Retry-After (seconds) honoured before retrying a request
+MAX_RETRY_AFTER = 60.0
+
+# Shared worker threads for background captcha fetch + OCR
+CAPTCHA_WORKERS = 4
+_captcha_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=CAPTCHA_WORKERS, thread_name_prefix="captcha"
+)
+
+
+# PDF GET + Ghostscript + archive write run here, overlapping the next order's
+# (session-serialized) requests. Shared by all tasks, so it also caps the number
+# of concurrent PDF downloads process-wide.
+PDF_WORKERS = 8
+_pdf_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=PDF_WORKERS, thread_name_prefix="pdf"
+)
+# Compressions (gs subprocesses, or in-process qpdf via pikepdf) run on the pdf
+# threads; cap concurrent ones at the core count so downloads waiting for a
+# slot are not starved of CPU by oversubscribed compressions
+_compress_slots = threading.BoundedSemaphore(os.cpu_count() or 1)
+# PDFs a downloader may have in flight at once
+MAX_PENDING_PDF_WRITES = 8
+
+
+def set_pdf_compressor(name: str, level: str = "screen") -> bool:
+    """Select the PDF compressor (and gs preset); returns whether it is available"""
+    global PDF_COMPRESSOR, PDF_COMPRESSION_LEVEL, COMPRESSION_AVAILABLE
+    PDF_COMPRESSOR = name
+    PDF_COMPRESSION_LEVEL = level
+    if name == "qpdf":
+        COMPRESSION_AVAILABLE = qpdf.check_pikepdf_available()
+    else:
+        COMPRESSION_AVAILABLE = check_ghostscript_available()
+    return COMPRESSION_AVAILABLE
+
+
+def set_pdf_workers(workers: int):
+    """Resize the shared PDF download pool; call before any task is submitted"""
+    global PDF_WORKERS, MAX_PENDING_PDF_WRITES, _pdf_executor
+    if workers == PDF_WORKERS:
+        return
+    old_executor = _pdf_executor
+    _pdf_executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="pdf"
+    )
+    PDF_WORKERS = workers
+    # Let a single task keep the whole pool busy
+    MAX_PENDING_PDF_WRITES = max(8, workers)
+    old_executor.shutdown(wait=False)
+
+
+# Archive entries buffered per downloader before one add_many call
+ARCHIVE_BATCH_SIZE = 64
+# json.dumps builds a new encoder whenever options are passed; build it once
+_METADATA_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+
+class CaptchaPrefetcher:
+    """
+    Fetches and solves the next captcha in the background while the caller
+    does other requests, hiding the captcha GET + OCR latency.
+
+    securimage keeps only the most recently issued code in the PHP session,
+    so a prefetch is only started when a captcha-gated request follows, and
+    get() waits for a running prefetch instead of fetching a second captcha
+    alongside it.
+    """
+
+    def __init__(self, solve_fn):
+        self._solve_fn = solve_fn
+        self._future: Optional[concurrent.futures.Future] = None
+        self._started_at = 0.0
+        self.lock = threading.Lock()
+
+    def start(self):
+        """Begin solving a captcha in the background if none is pending"""
+        with self.lock:
+            if self._future is None:
+                self._started_at = time.monotonic()
+                self._future = _captcha_executor.submit(self._solve_fn)
+
+    def get(self) -> Optional[str]:
+        """Take the prefetched solution, or None if absent, failed or stale"""
+        with self.lock:
+            future, self._future = self._future, None
+            started_at = self._started_at
+        if future is None:
+            return None
+
+        try:
+            # Bounded by the captcha GET timeouts and MAX_CAPTCHA_ATTEMPTS
+            captcha_text = future.result()
+        except Exception as e:
+            logger.debug(f"Captcha prefetch failed: {e}")
+            return None
+        if time.monotonic() - started_at > CAPTCHA_TTL_SECONDS:
+            logger.debug("Discarding stale prefetched captcha")
+            return None
+        return captcha_text
+
+    def cancel(self):
+        """Drop any pending prefetch, waiting for it so it cannot outlive the session lease"""
+        with self.lock:
+            future, self._future = self._future, None
+        if future is not None and not future.cancel():
+            concurrent.futures.wait([future])
+
 
 def get_task_key(task) -> str:
     """Generate a unique key for a task (court + date combination)"""
-    return f"{task.state_code}_{task.district_code}_{task.complex_code}_{task.from_date}_{task.to_date}"
+    key = getattr(task, "key", None)
+    if key:
+        return key
+    return "_".join(
+        (
+            task.state_code,
+            task.district_code,
+            task.complex_code,
+            task.from_date,
+            task.to_date,
+        )
+    )
 
 
 def load_completed_tasks() -> set:
-    """Load completed tasks from file"""
-    if not COMPLETED_TASKS_FILE.exists():
-        return set()
+    """Load completed tasks from the JSON file and the append-only log"""
+    completed = set()
+    if COMPLETED_TASKS_FILE.exists():
+        try:
+            with open(COMPLETED_TASKS_FILE, "r") as f:
+                data = json.load(f)
+                completed.update(data.get("completed", []))
+        except (json.JSONDecodeError, IOError):
+            pass
+    for log_path in (COMPLETED_TASKS_ROTATED_LOG, COMPLETED_TASKS_LOG):
+        if log_path.exists():
+            try:
+                with open(log_path, "r") as f:
+                    completed.update(line.strip() for line in f if line.strip())
+            except IOError:
+                pass
+    return completed
+
+
+def _load_once() -> set:
+    """Populate the in-memory completed set on first use (caller holds the lock)"""
+    global _completed_tasks
+    if _completed_tasks is None:
+        _completed_tasks = load_completed_tasks()
+    return _completed_tasks
+
+
+def compact_completed_tasks():
+    """
+    Rewrite the JSON file from the in-memory set and drop the log. Only the
+    snapshot and log rotation happen under completed_tasks_lock; serializing
+    and fsyncing the file does not block workers saving completions.
+    """
+    global _completed_log, _saves_since_compact
+    # One compaction at a time; a save that finds one running skips its own
+    if not _compaction_lock.acquire(blocking=False):
+        return
     try:
-        with open(COMPLETED_TASKS_FILE, "r") as f:
-            data = json.load(f)
-            return set(data.get("completed", []))
-    except (json.JSONDecodeError, IOError):
-        return set()
+        with completed_tasks_lock:
+            completed = list(_load_once())
+            if _completed_log is not None:
+                _completed_log.close()
+                _completed_log = None
+            # Later saves start a fresh log, so the rotated one holds exactly
+            # what the snapshot adds to the JSON file
+            if COMPLETED_TASKS_LOG.exists():
+                if COMPLETED_TASKS_ROTATED_LOG.exists():
+                    # Left by an interrupted compaction; keep its entries
+                    with open(COMPLETED_TASKS_ROTATED_LOG, "a") as f:
+                        f.write(COMPLETED_TASKS_LOG.read_text())
+                    COMPLETED_TASKS_LOG.unlink()
+                else:
+                    COMPLETED_TASKS_LOG.replace(COMPLETED_TASKS_ROTATED_LOG)
+            _saves_since_compact = 0
+
+        tmp_path = COMPLETED_TASKS_FILE.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"completed": completed}, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        tmp_path.replace(COMPLETED_TASKS_FILE)
+        COMPLETED_TASKS_ROTATED_LOG.unlink(missing_ok=True)
+    finally:
+        _compaction_lock.release()
 
 
 def save_completed_task(task_key: str):
-    """Save a completed task to file (thread-safe)"""
+    """Record a completed task in memory and append it to the log (thread-safe)"""
+    global _completed_log, _saves_since_compact
     with completed_tasks_lock:
-        completed = load_completed_tasks()
+        completed = _load_once()
+        if task_key in completed:
+            return
         completed.add(task_key)
-        with open(COMPLETED_TASKS_FILE, "w") as f:
-            json.dump({"completed": list(completed)}, f)
+
+        if _completed_log is None:
+            _completed_log = open(COMPLETED_TASKS_LOG, "a")
+        # flush() hands the line to the OS, which survives a process crash; a
+        # line lost to power failure only means re-running an idempotent task,
+        # so no fsync while every worker waits on the lock
+        _completed_log.write(task_key + "\n")
+        _completed_log.flush()
+        _saves_since_compact += 1
+
+    if _saves_since_compact >= COMPLETED_TASKS_COMPACT_EVERY:
+        compact_completed_tasks()
 
 
 def is_task_completed(task) -> bool:
     """Check if a task has already been completed"""
-    task_key = get_task_key(task)
-    completed = load_completed_tasks()
-    return task_key in completed
+    # Once loaded the set is only ever added to, so lookups skip the lock
+    completed = _completed_tasks
+    if completed is None:
+        with completed_tasks_lock:
+            completed = _load_once()
+    return get_task_key(task) in completed
+
+
+def _task_month_spans(task) -> list:
+    """
+    (month cell key, first day, last day, days in month) for each month the
+    task's date range touches; cell keys are "state_district_complex_YYYY-MM"
+    """
+    start = parse_date_from_api(task.from_date).date()
+    end = parse_date_from_api(task.to_date).date()
+    prefix = f"{task.state_code}_{task.district_code}_{task.complex_code}_"
+    spans = []
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+        month_days = (date(next_year, next_month, 1) - timedelta(days=1)).day
+        first = start.day if (year, month) == (start.year, start.month) else 1
+        last = end.day if (year, month) == (end.year, end.month) else month_days
+        spans.append((f"{prefix}{year:04d}-{month:02d}", first, last, month_days))
+        year, month = next_year, next_month
+    return spans
+
+
+def _day_keys(month_key: str, first: int, last: int) -> list:
+    """Day cell keys of month_key from day first to day last (inclusive)"""
+    return [f"{month_key}-{day:02d}" for day in range(first, last + 1)]
+
+
+def _load_empty_cells() -> set:
+    """Populate the in-memory empty-cell set on first use (caller holds the lock)"""
+    global _empty_cells
+    if _empty_cells is None:
+        _empty_cells = set()
+        if EMPTY_CELLS_FILE.exists():
+            try:
+                with open(EMPTY_CELLS_FILE, "r") as f:
+                    _empty_cells.update(line.strip() for line in f if line.strip())
+            except IOError:
+                pass
+    return _empty_cells
+
+
+def save_empty_task(task):
+    """
+    Record the days of a task whose search came back empty. A month becomes a
+    known-empty cell once every one of its days has been recorded, whether by
+    one task spanning it or by many shorter ones (e.g. --day_step 1).
+    """
+    with empty_cells_lock:
+        cells = _load_empty_cells()
+        new = []
+        for month_key, first, last, month_days in _task_month_spans(task):
+            if month_key in cells:
+                continue
+            if first > 1 or last < month_days:
+                new.extend(
+                    key
+                    for key in _day_keys(month_key, first, last)
+                    if key not in cells
+                )
+                cells.update(new)
+                if not all(
+                    key in cells for key in _day_keys(month_key, 1, month_days)
+                ):
+                    continue
+            new.append(month_key)
+            cells.add(month_key)
+        if new:
+            with open(EMPTY_CELLS_FILE, "a") as f:
+                f.write("".join(key + "\n" for key in new))
+
+
+def is_task_known_empty(task) -> bool:
+    """Check if every day the task covers was previously searched empty"""
+    with empty_cells_lock:
+        cells = _load_empty_cells()
+        return all(
+            month_key in cells
+            or all(key in cells for key in _day_keys(month_key, first, last))
+            for month_key, first, last, _ in _task_month_spans(task)
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class DistrictCourtTask:
     """A task representing a date range to process for a specific court complex"""
 
@@ -160,19 +887,19 @@ class DistrictCourtTask:
     from_date: str  # DD-MM-YYYY format
     to_date: str  # DD-MM-YYYY format
     order_type: str = "both"  # "interim", "finalorder", or "both"
+    # Completed-tasks key, built once since every task is looked up several times
+    key: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.key = get_task_key(self)
 
     def __str__(self):
         return f"Task({self.state_name}/{self.district_name}/{self.complex_name}, {self.from_date} to {self.to_date})"
 
 
-def format_date_for_api(date_str: str) -> str:
-    """Convert YYYY-MM-DD to DD-MM-YYYY format"""
-    dt = datetime.strptime(date_str, "%Y-%m-%d")
-    return dt.strftime("%d-%m-%Y")
-
-
+@functools.lru_cache(maxsize=8192)
 def parse_date_from_api(date_str: str) -> datetime:
-    """Convert DD-MM-YYYY to datetime"""
+    """Convert DD-MM-YYYY to datetime (cached; orders share few distinct dates)"""
     return datetime.strptime(date_str, "%d-%m-%Y")
 
 
@@ -180,19 +907,26 @@ def get_date_ranges(
     start_date: str, end_date: str, day_step: int = 1
 ) -> Generator[tuple[str, str], None, None]:
     """Generate date ranges in YYYY-MM-DD format"""
-    start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-    end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-
+    start = np.datetime64(start_date, "D")
     # Cap at today
-    today = datetime.now().date()
-    if end_dt.date() > today:
-        end_dt = datetime.combine(today, datetime.min.time())
+    end = min(np.datetime64(end_date, "D"), np.datetime64(datetime.now().date(), "D"))
+
+    # All range bounds in one vectorized pass; datetime64[D] renders as YYYY-MM-DD
+    starts = np.arange(start, end + 1, np.timedelta64(day_step, "D"))
+    ends = np.minimum(starts + np.timedelta64(day_step - 1, "D"), end)
+    yield from zip(starts.astype(str).tolist(), ends.astype(str).tolist())
+
+
+def count_date_ranges(start_date: str, end_date: str, day_step: int = 1) -> int:
+    """Number of ranges get_date_ranges yields, without generating them"""
+    start = np.datetime64(start_date, "D")
+    end = min(np.datetime64(end_date, "D"), np.datetime64(datetime.now().date(), "D"))
+    days = int((end - start) // np.timedelta64(1, "D")) + 1
+    return max(0, -(-days // day_step))
+
 
-    current = start_dt
-    while current <= end_dt:
-        range_end = min(current + timedelta(days=day_step - 1), end_dt)
-        yield (current.strftime("%Y-%m-%d"), range_end.strftime("%Y-%m-%d"))
-        current = range_end + timedelta(days=1)
+# Task ids are process-local (never sent to the server), so a counter will do
+_task_ids = itertools.count()
 
 
 def generate_tasks(
@@ -203,9 +937,12 @@ def generate_tasks(
 ) -> Generator[DistrictCourtTask, None, None]:
     """Generate tasks for all courts and date ranges"""
     for from_date, to_date in get_date_ranges(start_date, end_date, day_step):
+        # Same range for every court; format it once (YYYY-MM-DD -> DD-MM-YYYY)
+        from_date_api = f"{from_date[8:10]}-{from_date[5:7]}-{from_date[:4]}"
+        to_date_api = f"{to_date[8:10]}-{to_date[5:7]}-{to_date[:4]}"
         for court in courts:
             yield DistrictCourtTask(
-                id=str(uuid.uuid4()),
+                id=f"t{next(_task_ids)}",
                 state_code=court.state_code,
                 state_name=court.state_name,
                 district_code=court.district_code,
@@ -213,8 +950,8 @@ def generate_tasks(
                 complex_code=court.complex_code,
                 complex_name=court.complex_name,
                 court_numbers=court.court_numbers,
-                from_date=format_date_for_api(from_date),
-                to_date=format_date_for_api(to_date),
+                from_date=from_date_api,
+                to_date=to_date_api,
                 order_type="both",  # "interim", "finalorder", or "both"
             )
 
@@ -231,76 +968,166 @@ class Downloader:
     ):
         self.task = task
         self.archive_manager = archive_manager
-        self.session = requests.Session()
-        self.session.headers.update(HEADERS)
-        self.app_token = None
-        self.session_cookie = None
+        self._pool_key = (task.state_code, task.district_code, task.complex_code)
+        self._state = session_pool.lease(self._pool_key)
+        self.session = self._state.session
+        self.app_token = self._state.app_token
+        self.session_cookie = self._state.session_cookie
         # PDF compression (enabled by default if Ghostscript is available)
         self.compress_pdfs = compress_pdfs and COMPRESSION_AVAILABLE
         # Fetch detailed case information (CNR, filing date, hearing dates, etc.)
         self.fetch_case_details_enabled = fetch_case_details
+        self._captcha_prefetcher = CaptchaPrefetcher(self._solve_captcha_inline)
+        self._pending_writes: List[concurrent.futures.Future] = []
+        self._archive_buffer: List[tuple] = []
+        # (archive_type, year, filename) written or queued by this downloader
+        self._queued_files: set = set()
+        # PDFs this downloader has stored, counted as background fetches finish
+        self._stored_pdfs = 0
+        self._stored_pdfs_lock = threading.Lock()
+        # Parsed case details by CNR, shared by orders of the same case
+        self._case_details_cache: Dict[str, dict] = {}
+        # Court codes of this complex, for filtering case status results
+        self._valid_court_codes = frozenset(
+            c.strip() for c in task.court_numbers.split(",")
+        )
 
     def _extract_app_token(self, html: str) -> Optional[str]:
-        """Extract app_token from HTML content"""
-        soup = BeautifulSoup(html, "lxml")
-        token_input = soup.find("input", {"name": "app_token"})
-        if token_input:
-            return token_input.get("value", "")
-
-        pattern = r"app_token['\"]?\s*[:=]\s*['\"]([^'\"]+)['\"]"
-        match = re.search(pattern, html)
+        """
+        Extract app_token from HTML content: the hidden app_token input first,
+        then the JS/URL patterns. Input tags are read with regexes; the page is
+        only parsed when that is ambiguous (an input mentions app_token but
+        could not be read, or a comment is left unterminated).
+        """
+        ambiguous = False
+        if "<!--" in html:
+            html_text = _HTML_COMMENT_RE.sub("", html)
+            # An unterminated comment runs to the end of the document
+            unterminated = html_text.find("<!--")
+            if unterminated != -1:
+                html_text = html_text[:unterminated]
+                ambiguous = True
+        else:
+            html_text = html
+        for tag in _INPUT_TAG_RE.finditer(html_text):
+            attrs = {}
+            for name, double, single, bare in _TAG_ATTR_RE.findall(tag.group(1)):
+                attrs.setdefault(name.lower(), double or single or bare)
+            if attrs.get("name") == "app_token":
+                return html_unescape(attrs.get("value", ""))
+            if "app_token" in tag.group(1):
+                ambiguous = True
+
+        if ambiguous:
+            token = self._parse_app_token_input(html)
+            if token is not None:
+                return token
+
+        match = _APP_TOKEN_RE1.search(html)
         if match:
             return match.group(1)
 
-        pattern2 = r"app_token=([^&'\"]+)"
-        match = re.search(pattern2, html)
+        match = _APP_TOKEN_RE2.search(html)
         if match:
             return match.group(1)
 
+        if not ambiguous:
+            return self._parse_app_token_input(html)
+        return None
+
+    @staticmethod
+    def _parse_app_token_input(html: str) -> Optional[str]:
+        """Value of the first <input name="app_token">, found with a full parse"""
+        try:
+            tree = lxml.html.document_fromstring(html, parser=_html_parser())
+        except lxml.etree.ParserError:
+            return None
+        token_inputs = _APP_TOKEN_INPUT_XPATH(tree)
+        if token_inputs:
+            return token_inputs[0].get("value", "")
         return None
 
     def _update_token(self, response_json: dict):
         """Update app_token from API response"""
         if "app_token" in response_json:
             self.app_token = response_json["app_token"]
+            if self._state is not None:
+                self._state.app_token = self.app_token
             logger.debug(f"Updated app_token: {self.app_token[:20]}...")
 
     def init_session(self):
         """Initialize session and get app_token"""
         logger.debug(f"Initializing session for task: {self.task}")
 
-        # Add small random delay to avoid rate limiting
-        time.sleep(random.uniform(0.5, 1.5))
+        # Wait for the shared rate budget to avoid rate limiting
+        init_rate_limiter.acquire()
 
         # Get the court orders page with retry
         url = f"{BASE_URL}?p=courtorder/index"
-        response = self._fetch_with_retry("GET", url, timeout=30, verify=False)
+        response = self._fetch_with_retry("GET", url, timeout=30)
 
         # Handle rate limiting (405 Security Page)
         if response.status_code == 405:
+            init_rate_limiter.penalize()
             logger.warning("Rate limited (405). Waiting 30s before retry...")
             time.sleep(30)
-            response = self._fetch_with_retry("GET", url, timeout=30, verify=False)
+            response = self._fetch_with_retry("GET", url, timeout=30)
 
         response.raise_for_status()
+        init_rate_limiter.recover()
 
         # Extract app_token
         self.app_token = self._extract_app_token(response.text)
         if not self.app_token:
-            token_match = re.search(r"app_token=([^&'\"]+)", response.url)
+            token_match = _APP_TOKEN_RE2.search(response.url)
             if token_match:
                 self.app_token = token_match.group(1)
 
         if not self.app_token:
             raise ValueError("Could not extract app_token from page")
+        self._state.app_token = self.app_token
 
         # Get session cookies
         self.session_cookie = response.cookies.get("SERVICES_SESSID")
         if not self.session_cookie:
             self.session_cookie = response.cookies.get("PHPSESSID")
+        self._state.session_cookie = self.session_cookie
+        self._state.initialized_at = time.monotonic()
 
         logger.debug(f"Got app_token: {self.app_token[:20]}...")
 
+    def prepare_session(self) -> bool:
+        """
+        Initialize the session unless the pooled one was initialized recently,
+        then set the court data. A reused token the server no longer accepts
+        is dropped and the session re-initialized once.
+        """
+        reused = (
+            self.app_token is not None
+            and time.monotonic() - self._state.initialized_at
+            < SESSION_TOKEN_TTL_SECONDS
+        )
+        if not reused:
+            self.init_session()
+
+        # Solve the search captcha while the court data request is in flight
+        self._captcha_prefetcher.start()
+
+        try:
+            if self.set_court_data():
+                return True
+        except requests.exceptions.HTTPError:
+            if not reused:
+                raise
+        if not reused:
+            return False
+
+        logger.debug(f"Pooled session rejected, re-initializing: {self.task}")
+        self._captcha_prefetcher.cancel()
+        self.init_session()
+        self._captcha_prefetcher.start()
+        return self.set_court_data()
+
     def set_court_data(self):
         """Set the court complex in the session"""
         url = f"{BASE_URL}?p=casestatus/set_data"
@@ -317,12 +1144,10 @@ class Downloader:
             "app_token": self.app_token,
         }
 
-        response = self._fetch_with_retry(
-            "POST", url, data=data, timeout=30, verify=False
-        )
+        response = self._fetch_with_retry("POST", url, data=data, timeout=30)
         response.raise_for_status()
 
-        result = response.json()
+        result = json.loads(response.content)
         self._update_token(result)
 
         if result.get("status") != 1:
@@ -331,169 +1156,162 @@ class Downloader:
 
         return True
 
-    def solve_captcha(self, retries: int = 0) -> str:
-        """Solve CAPTCHA using ONNX model"""
-        if retries > 10:
-            raise ValueError("Failed to solve CAPTCHA after 10 attempts")
-
-        # Get captcha image with retry
-        captcha_url = (
-            f"{BASE_URL}vendor/securimage/securimage_show.php?{uuid.uuid4().hex}"
-        )
-        response = self._fetch_with_retry("GET", captcha_url, timeout=30, verify=False)
-
-        # Save and process
-        unique_id = uuid.uuid4().hex[:8]
-        captcha_path = captcha_tmp_dir / f"captcha_dc_{unique_id}.png"
-        with open(captcha_path, "wb") as f:
-            f.write(response.content)
+    def solve_captcha(self) -> str:
+        """Return the prefetched captcha solution if available, else solve inline"""
+        captcha_text = self._captcha_prefetcher.get()
+        if captcha_text:
+            return captcha_text
+        return self._solve_captcha_inline()
 
-        try:
-            img = Image.open(captcha_path)
-            captcha_text = get_text(img).strip()
+    def _solve_captcha_inline(self) -> str:
+        """Solve CAPTCHA using ONNX model"""
+        for attempt in range(MAX_CAPTCHA_ATTEMPTS):
+            # Get captcha image with retry
+            captcha_url = (
+                f"{BASE_URL}vendor/securimage/securimage_show.php?{time.time_ns()}"
+            )
+            response = self._fetch_with_retry("GET", captcha_url, timeout=30)
 
-            # eCourts captcha is 6 characters
-            if len(captcha_text) != 6:
+            # Decode in memory; only failures are written to disk
+            try:
+                img = Image.open(io.BytesIO(response.content))
+                img.load()
+                if CAPTCHA_BINARIZE:
+                    img = _binarize_captcha(img)
+                captcha_text = get_text(img).strip()
+
+                # eCourts captcha is 6 characters
+                if len(captcha_text) == 6:
+                    return captcha_text
                 logger.debug(f"Invalid captcha length: {captcha_text}")
-                captcha_path.unlink()
-                return self.solve_captcha(retries + 1)
 
-            captcha_path.unlink()
-            return captcha_text
-
-        except Exception as e:
-            logger.error(f"Error solving captcha: {e}")
-            # Move to failures dir for debugging (if file exists)
-            if captcha_path.exists():
-                new_path = (
-                    captcha_failures_dir / f"{uuid.uuid4().hex[:8]}_{captcha_path.name}"
-                )
+            except Exception as e:
+                logger.error(f"Error solving captcha: {e}")
+                # Save to failures dir for debugging
+                fail_path = captcha_failures_dir / f"captcha_dc_{uuid.uuid4().hex[:8]}.png"
                 try:
-                    captcha_path.rename(new_path)
-                except Exception:
-                    pass  # Ignore if file was already moved/deleted
-            return self.solve_captcha(retries + 1)
+                    fail_path.write_bytes(response.content)
+                except OSError:
+                    pass
+
+        raise ValueError(
+            f"Failed to solve CAPTCHA after {MAX_CAPTCHA_ATTEMPTS} attempts"
+        )
 
     def search_orders(self) -> Optional[str]:
-        """Search for orders by date range"""
+        """
+        Search for orders by date range. Returns the results HTML ("" when the
+        search succeeded but found nothing), or None if the search failed.
+        """
         url = f"{BASE_URL}?p=courtorder/submitOrderDate"
 
-        # Solve captcha
-        captcha_code = self.solve_captcha()
-
-        data = {
-            "state_code": self.task.state_code,
-            "dist_code": self.task.district_code,
-            "court_complex": self.task.complex_code,
-            "court_complex_arr": self.task.court_numbers,
-            "est_code": "",
-            "from_date": self.task.from_date,
-            "to_date": self.task.to_date,
-            "fradorderdt": self.task.order_type,  # "interim", "finalorder", or "both"
-            "orderflagvaldate": self.task.order_type,  # "interim", "finalorder", or "both"
-            "order_date_captcha_code": captcha_code,  # Correct field name for captcha
-            "ajax_req": "true",
-            "app_token": self.app_token,
-        }
+        for attempt in range(MAX_CAPTCHA_ATTEMPTS):
+            # Solve captcha
+            captcha_code = self.solve_captcha()
 
-        try:
-            response = self._fetch_with_retry(
-                "POST", url, data=data, timeout=60, verify=False
-            )
-            response.raise_for_status()
+            data = {
+                "state_code": self.task.state_code,
+                "dist_code": self.task.district_code,
+                "court_complex": self.task.complex_code,
+                "court_complex_arr": self.task.court_numbers,
+                "est_code": "",
+                "from_date": self.task.from_date,
+                "to_date": self.task.to_date,
+                "fradorderdt": self.task.order_type,  # "interim", "finalorder", or "both"
+                "orderflagvaldate": self.task.order_type,  # "interim", "finalorder", or "both"
+                "order_date_captcha_code": captcha_code,  # Correct field name for captcha
+                "ajax_req": "true",
+                "app_token": self.app_token,
+            }
 
-            # Check if response is JSON with token update
             try:
-                result = response.json()
-                self._update_token(result)
-
-                # Check for captcha error
-                if result.get("errormsg"):
-                    logger.warning(f"Search error: {result.get('errormsg')}")
-                    if "captcha" in result.get("errormsg", "").lower():
-                        return self.search_orders()  # Retry with new captcha
-                    return None
-
-                # Check status
-                if result.get("status") != 1:
-                    logger.debug(f"Search returned non-success status: {result}")
-                    return None
-
-                # Check for HTML content in response (court_dt_data field)
-                if "court_dt_data" in result:
-                    return result["court_dt_data"]
-                if "html" in result:
-                    return result["html"]
-
-            except json.JSONDecodeError:
-                # Response is HTML
+                response = self._fetch_with_retry("POST", url, data=data, timeout=60)
+                response.raise_for_status()
+
+                # Check if response is JSON with token update
+                try:
+                    result = json.loads(response.content)
+                    self._update_token(result)
+
+                    # Check for captcha error
+                    if result.get("errormsg"):
+                        logger.warning(f"Search error: {result.get('errormsg')}")
+                        if "captcha" in result.get("errormsg", "").lower():
+                            continue  # Retry with new captcha
+                        return None
+
+                    # Check status
+                    if result.get("status") != 1:
+                        logger.debug(f"Search returned non-success status: {result}")
+                        return None
+
+                    # Check for HTML content in response (court_dt_data field)
+                    if "court_dt_data" in result:
+                        return result["court_dt_data"] or ""
+                    if "html" in result:
+                        return result["html"] or ""
+
+                except ValueError:
+                    # Response is HTML (json.loads raises UnicodeDecodeError,
+                    # also a ValueError, for a body that is not UTF-8)
+                    return response.text
+
                 return response.text
 
-            return response.text
+            except (
+                ConnectionError,
+                Timeout,
+                ChunkedEncodingError,
+                urllib3.exceptions.ProtocolError,
+            ) as e:
+                logger.error(f"Network error searching orders (after retries): {e}")
+                return None
+            except Exception as e:
+                logger.error(f"Error searching orders: {e}")
+                return None
 
-        except (
-            ConnectionError,
-            Timeout,
-            ChunkedEncodingError,
-            urllib3.exceptions.ProtocolError,
-        ) as e:
-            logger.error(f"Network error searching orders (after retries): {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Error searching orders: {e}")
-            return None
+        logger.error(
+            f"Search rejected captcha {MAX_CAPTCHA_ATTEMPTS} times for task: {self.task}"
+        )
+        return None
 
     def parse_order_results(self, html: str) -> List[dict]:
         """Parse order search results from HTML"""
-        soup = BeautifulSoup(html, "lxml")
         results = []
+        if not html or not html.strip():
+            return results
+        tree = lxml.html.fromstring(html, parser=_html_parser())
+
+        # Look for the results table, else the first table with data rows
+        table = next(iter(_CASE_LIST_XPATH(tree)), None)
+        if table is None:
+            table = next(
+                (t for t in _TABLES_XPATH(tree) if len(_ROWS_XPATH(t)) > 1), None
+            )
 
-        # Look for the results table
-        table = soup.find("table", {"id": "caseList"})
-        if not table:
-            tables = soup.find_all("table")
-            for t in tables:
-                rows = t.find_all("tr")
-                if len(rows) > 1:  # Has data rows
-                    table = t
-                    break
-
-        if not table:
+        if table is None:
             return results
 
-        rows = table.find_all("tr")
-        for row in rows:
-            cells = row.find_all("td")
+        for row in _ROWS_XPATH(table):
+            cells = _CELLS_XPATH(row)
             if not cells:
                 continue
 
-            order_data = {
-                "raw_html": str(row),
-            }
-
-            # Column name mapping for the order results table
-            # The table structure is: Serial | Case Number | Parties | Order Date | Order Link
-            column_names = [
-                "serial_number",
-                "case_number",
-                "parties",
-                "order_date",
-                "document_type",
-            ]
+            # Serialized only for rows that are kept, but stays the first key
+            order_data = {"raw_html": None}
 
             # Extract data from cells with proper field names
             for idx, cell in enumerate(cells):
-                text = cell.get_text(strip=True)
+                text, link, button = _scan_cell(cell)
                 if text:
                     # Use proper field name if available, otherwise fall back to indexed name
-                    if idx < len(column_names):
-                        order_data[column_names[idx]] = text
+                    if idx < len(ORDER_COLUMN_NAMES):
+                        order_data[ORDER_COLUMN_NAMES[idx]] = text
                     else:
                         order_data[f"column_{idx}"] = text
 
                 # Look for links/buttons with PDF info
-                link = cell.find("a")
-                if link:
+                if link is not None:
                     href = link.get("href", "")
                     onclick = link.get("onclick", "")
                     if href:
@@ -501,37 +1319,36 @@ class Downloader:
                     if onclick:
                         order_data["onclick"] = onclick
 
-                button = cell.find("button")
-                if button:
+                if button is not None:
                     onclick = button.get("onclick", "")
                     if onclick:
                         order_data["onclick"] = onclick
 
+            if not (order_data.get("onclick") or order_data.get("pdf_href")):
+                continue
+            order_data["raw_html"] = lxml.html.tostring(
+                row, encoding="unicode", with_tail=False
+            )
+
             # Parse parties into petitioner and respondent if possible
             if order_data.get("parties"):
-                parties = order_data["parties"]
-                # Try different separator patterns: "Vs", "VS", "vs", "V/s", "v/s"
-                for separator in ["Vs", "VS", "vs", "V/s", "v/s", " v ", " V "]:
-                    if separator in parties:
-                        parts = parties.split(separator, 1)
-                        if len(parts) == 2:
-                            order_data["petitioner"] = parts[0].strip()
-                            order_data["respondent"] = parts[1].strip()
-                        break
-
-            # Try to extract CNR (16-char format)
-            cnr_match = re.search(r"\b([A-Z]{4}\d{12})\b", str(row))
+                parties = _split_parties(order_data["parties"])
+                if parties:
+                    order_data["petitioner"], order_data["respondent"] = parties
+
+            # Try to extract CNR (16-char format). Search the markup rather than
+            # the row text: some rows carry the CNR only in onclick arguments
+            cnr_match = _CNR_RE.search(order_data["raw_html"])
             if cnr_match:
                 order_data["cnr"] = cnr_match.group(1)
             # If no CNR, try to use case number as unique identifier
             elif order_data.get("case_number"):
                 # Sanitize case number for filename: MVOP/63/2021 -> MVOP_63_2021
                 case_no = order_data["case_number"]
-                case_id = re.sub(r"[^\w\d.-]", "_", case_no)
+                case_id = _CASE_NO_SANITIZE_RE.sub("_", case_no)
                 order_data["cnr"] = case_id
 
-            if order_data.get("onclick") or order_data.get("pdf_href"):
-                results.append(order_data)
+            results.append(order_data)
 
         return results
 
@@ -539,9 +1356,16 @@ class Downloader:
         """
         Fetch case type code mapping from fillCaseType API.
 
+        The mapping is memoized per court complex in the session pool, so only
+        the first task for a complex pays for the request.
+
         Returns:
             Dictionary mapping short code (e.g., "OS") to internal code (e.g., "17^43")
         """
+        cached = session_pool.get_case_types(self._pool_key)
+        if cached is not None:
+            return cached
+
         url = f"{BASE_URL}?p=casestatus/fillCaseType"
 
         data = {
@@ -555,22 +1379,22 @@ class Downloader:
         }
 
         try:
-            response = self._fetch_with_retry(
-                "POST", url, data=data, timeout=30, verify=False
-            )
+            response = self._fetch_with_retry("POST", url, data=data, timeout=30)
             response.raise_for_status()
 
-            result = response.json()
+            result = json.loads(response.content)
             self._update_token(result)
 
             case_type_mapping = {}
-            casetype_html = result.get("casetype_list", "")
+            casetype_html = result.get("casetype_list") or ""
 
-            if casetype_html:
-                soup = BeautifulSoup(casetype_html, "lxml")
-                for option in soup.find_all("option"):
+            if casetype_html.strip():
+                tree = lxml.html.document_fromstring(
+                    casetype_html, parser=_html_parser()
+                )
+                for option in tree.iter("option"):
                     value = option.get("value", "").strip()
-                    text = option.get_text(strip=True)
+                    text = _get_text(option)
 
                     if value and text:
                         # Extract short code from text like "OS - ORIGINAL SUIT"
@@ -579,6 +1403,8 @@ class Downloader:
                         )
                         case_type_mapping[short_code] = value
 
+            if case_type_mapping:
+                session_pool.set_case_types(self._pool_key, case_type_mapping)
             return case_type_mapping
 
         except Exception as e:
@@ -591,6 +1417,9 @@ class Downloader:
         """
         Search Case Status by case number to get list of matching cases.
 
+        Non-empty results are memoized per court complex in the session pool,
+        so further orders of the same case skip the captcha and request.
+
         Args:
             case_type_code: Internal case type code (e.g., "17^43" for OS)
             case_number: Case number (e.g., "32")
@@ -599,60 +1428,72 @@ class Downloader:
         Returns:
             List of case dictionaries with viewHistory parameters
         """
+        cache_key = (*self._pool_key, case_type_code, case_number, year)
+        cached = session_pool.get_case_status(cache_key)
+        if cached is not None:
+            return list(cached)
+
         url = f"{BASE_URL}?p=casestatus/submitCaseNo"
 
-        # Solve captcha for this request
-        captcha_code = self.solve_captcha()
+        for attempt in range(MAX_CAPTCHA_ATTEMPTS):
+            # Solve captcha for this request
+            captcha_code = self.solve_captcha()
 
-        # API parameters must match actual form submission
-        data = {
-            "state_code": self.task.state_code,
-            "dist_code": self.task.district_code,
-            "court_complex_code": self.task.complex_code,
-            "est_code": "",
-            "case_type": case_type_code,
-            "search_case_no": case_number,
-            "case_no": case_number,
-            "rgyear": year,
-            "case_captcha_code": captcha_code,
-            "ajax_req": "true",
-            "app_token": self.app_token,
-        }
-
-        try:
-            response = self._fetch_with_retry(
-                "POST", url, data=data, timeout=60, verify=False
-            )
-            response.raise_for_status()
+            # API parameters must match actual form submission
+            data = {
+                "state_code": self.task.state_code,
+                "dist_code": self.task.district_code,
+                "court_complex_code": self.task.complex_code,
+                "est_code": "",
+                "case_type": case_type_code,
+                "search_case_no": case_number,
+                "case_no": case_number,
+                "rgyear": year,
+                "case_captcha_code": captcha_code,
+                "ajax_req": "true",
+                "app_token": self.app_token,
+            }
 
             try:
-                result = response.json()
-                self._update_token(result)
-
-                # Check for captcha error
-                if result.get("errormsg"):
-                    error_msg = result.get("errormsg", "").lower()
-                    if "captcha" in error_msg:
-                        logger.debug("Captcha error in case status search, retrying...")
-                        return self.search_case_status(
-                            case_type_code, case_number, year
+                response = self._fetch_with_retry("POST", url, data=data, timeout=60)
+                response.raise_for_status()
+
+                try:
+                    result = json.loads(response.content)
+                    self._update_token(result)
+
+                    # Check for captcha error
+                    if result.get("errormsg"):
+                        error_msg = result.get("errormsg", "").lower()
+                        if "captcha" in error_msg:
+                            logger.debug(
+                                "Captcha error in case status search, retrying..."
+                            )
+                            continue
+                        logger.debug(
+                            f"Case status search error: {result.get('errormsg')}"
                         )
-                    logger.debug(f"Case status search error: {result.get('errormsg')}")
-                    return []
+                        return []
 
-                # Parse case_data HTML to extract viewHistory parameters
-                case_data_html = result.get("case_data", "")
-                if not case_data_html:
-                    return []
+                    # Parse case_data HTML to extract viewHistory parameters
+                    case_data_html = result.get("case_data", "")
+                    if not case_data_html:
+                        return []
+
+                    cases = self._parse_case_list(case_data_html)
+                    if cases:
+                        session_pool.set_case_status(cache_key, cases)
+                    return list(cases)
 
-                return self._parse_case_list(case_data_html)
+                except (json.JSONDecodeError, ValueError):
+                    return []
 
-            except (json.JSONDecodeError, ValueError):
+            except Exception as e:
+                logger.debug(f"Error in case status search: {e}")
                 return []
 
-        except Exception as e:
-            logger.debug(f"Error in case status search: {e}")
-            return []
+        logger.debug(f"Case status search rejected captcha {MAX_CAPTCHA_ATTEMPTS} times")
+        return []
 
     def _parse_case_list(self, html: str) -> List[Dict]:
         """
@@ -662,19 +1503,16 @@ class Downloader:
         Also extracts party names from the table row for matching purposes.
         """
         cases = []
-        soup = BeautifulSoup(html, "lxml")
+        if not html or not html.strip():
+            return cases
+        tree = lxml.html.fromstring(html, parser=_html_parser())
 
         # Find all View links with viewHistory onclick
-        for link in soup.find_all("a", onclick=True):
+        for link in tree.xpath("//a[contains(@onclick, 'viewHistory')]"):
             onclick = link.get("onclick", "")
-            if "viewHistory" not in onclick:
-                continue
 
             # Parse viewHistory(case_no, cino, court_code, hideparty, search_flag, state_code, dist_code, complex_code, search_by)
-            match = re.search(
-                r"viewHistory\s*\(\s*(\d+)\s*,\s*'([^']+)'\s*,\s*(\d+)\s*,\s*'([^']*)'\s*,\s*'([^']+)'\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*'([^']+)'\s*\)",
-                onclick,
-            )
+            match = _VIEW_HISTORY_RE.search(onclick)
             if match:
                 case_info = {
                     "internal_case_no": match.group(1),
@@ -690,18 +1528,16 @@ class Downloader:
 
                 # Extract party names from the table row
                 # Table structure: <tr><td>Sr</td><td>Case</td><td>Parties</td><td><a>View</a></td></tr>
-                row = link.find_parent("tr")
-                if row:
-                    cells = row.find_all("td")
+                rows = link.xpath("ancestor::tr[1]")
+                if rows:
+                    cells = _CELLS_XPATH(rows[0])
                     if len(cells) >= 3:
                         # Third cell contains "Petitioner<br>Vs</br>Respondent"
                         parties_cell = cells[2]
-                        parties_text = parties_cell.get_text(separator=" ").strip()
+                        parties_text = " ".join(parties_cell.itertext()).strip()
                         # Parse "Petitioner Vs Respondent" format (Vs may or may not have surrounding spaces)
                         # Pattern handles: "Name Vs Name", "Name VsName", "NameVs Name", "NameVsName"
-                        vs_match = re.search(
-                            r"(.+?)\s*vs\s*(.+)", parties_text, flags=re.IGNORECASE
-                        )
+                        vs_match = _VS_RE.search(parties_text)
                         if vs_match:
                             case_info["petitioner"] = vs_match.group(1).strip()
                             case_info["respondent"] = vs_match.group(2).strip()
@@ -740,12 +1576,10 @@ class Downloader:
         }
 
         try:
-            response = self._fetch_with_retry(
-                "POST", url, data=data, timeout=60, verify=False
-            )
+            response = self._fetch_with_retry("POST", url, data=data, timeout=60)
             response.raise_for_status()
 
-            result = response.json()
+            result = json.loads(response.content)
             self._update_token(result)
 
             if result.get("errormsg"):
@@ -783,23 +1617,30 @@ class Downloader:
         Returns:
             Dictionary with all extracted case details
         """
-        soup = BeautifulSoup(html, "lxml")
         details = {}
+        if not html or not html.strip():
+            return details
+        tree = lxml.html.fromstring(html, parser=_html_parser())
+
+        # Collect (label, value) pairs for every cell followed by a sibling cell
+        # in a single pass, in document order
+        cell_pairs = []
+        for td in tree.iter("td"):
+            next_td = next(td.itersiblings("td"), None)
+            if next_td is not None:
+                cell_pairs.append((_get_text(td).lower(), _get_text(next_td)))
 
         # Helper to extract text from table cells
         def get_cell_value(label: str) -> Optional[str]:
             """Find a label and return the next cell's value"""
-            for td in soup.find_all("td"):
-                text = td.get_text(strip=True)
-                if label.lower() in text.lower():
-                    next_td = td.find_next_sibling("td")
-                    if next_td:
-                        return next_td.get_text(strip=True)
+            label = label.lower()
+            for text, value in cell_pairs:
+                if label in text:
+                    return value
             return None
 
         # Extract CNR Number (16 character format: XXXX########YYYY)
-        cnr_pattern = r"\b([A-Z]{4}\d{12})\b"
-        cnr_match = re.search(cnr_pattern, html)
+        cnr_match = _CNR_RE.search(html)
         if cnr_match:
             details["cnr"] = cnr_match.group(1)
 
@@ -823,14 +1664,18 @@ class Downloader:
         if not details.get("court_number_and_judge"):
             details["court_number_and_judge"] = get_cell_value("Court No")
 
+        # Locate all section headings in one pass over the text nodes
+        pet_section, resp_section, acts_section, history_section = _find_strings(
+            tree, (_PETITIONER_RE, _RESPONDENT_RE, _ACTS_RE, _HISTORY_RE)
+        )
+
         # Extract Petitioner and Advocate section
         petitioners = []
-        pet_section = soup.find(string=re.compile(r"Petitioner.*Advocate", re.I))
-        if pet_section:
-            parent = pet_section.find_parent("div") or pet_section.find_parent("table")
-            if parent:
-                for item in parent.find_all(["li", "tr", "p"]):
-                    text = item.get_text(strip=True)
+        if pet_section is not None:
+            parent = _section_parent(pet_section)
+            if parent is not None:
+                for item in parent.iterdescendants("li", "tr", "p"):
+                    text = _get_text(item)
                     if text and "petitioner" not in text.lower():
                         petitioners.append(text)
         if petitioners:
@@ -838,14 +1683,11 @@ class Downloader:
 
         # Extract Respondent and Advocate section
         respondents = []
-        resp_section = soup.find(string=re.compile(r"Respondent.*Advocate", re.I))
-        if resp_section:
-            parent = resp_section.find_parent("div") or resp_section.find_parent(
-                "table"
-            )
-            if parent:
-                for item in parent.find_all(["li", "tr", "p"]):
-                    text = item.get_text(strip=True)
+        if resp_section is not None:
+            parent = _section_parent(resp_section)
+            if parent is not None:
+                for item in parent.iterdescendants("li", "tr", "p"):
+                    text = _get_text(item)
                     if text and "respondent" not in text.lower():
                         respondents.append(text)
         if respondents:
@@ -853,18 +1695,15 @@ class Downloader:
 
         # Extract Acts section
         acts = []
-        acts_section = soup.find(string=re.compile(r"Under Act", re.I))
-        if acts_section:
-            parent = acts_section.find_parent("table")
-            if parent:
-                rows = parent.find_all("tr")
+        if acts_section is not None:
+            parent = _first(_NEAREST_TABLE_XPATH(_string_parent(acts_section)))
+            if parent is not None:
+                rows = list(parent.iterdescendants("tr"))
                 for row in rows[1:]:  # Skip header row
-                    cells = row.find_all("td")
+                    cells = list(row.iterdescendants("td"))
                     if len(cells) >= 2:
-                        act = cells[0].get_text(strip=True)
-                        section = (
-                            cells[1].get_text(strip=True) if len(cells) > 1 else ""
-                        )
+                        act = _get_text(cells[0])
+                        section = _get_text(cells[1]) if len(cells) > 1 else ""
                         if act:
                             acts.append({"act": act, "section": section})
         if acts:
@@ -872,24 +1711,27 @@ class Downloader:
 
         # Extract Case History
         history = []
-        history_section = soup.find(string=re.compile(r"Case History", re.I))
-        if history_section:
-            parent = history_section.find_parent("table") or history_section.find_next(
-                "table"
-            )
-            if parent:
-                rows = parent.find_all("tr")
+        if history_section is not None:
+            section_el = _string_parent(history_section)
+            parent = _first(_NEAREST_TABLE_XPATH(section_el))
+            if parent is None:
+                # Next table after the heading text
+                if history_section.is_text:
+                    parent = _first(_TABLE_AFTER_TEXT_XPATH(section_el))
+                else:
+                    parent = _first(_TABLE_AFTER_TAIL_XPATH(history_section.getparent()))
+            if parent is not None:
                 headers = []
-                for row in rows:
-                    cells = row.find_all(["td", "th"])
+                for row in parent.iterdescendants("tr"):
+                    cells = list(row.iterdescendants("td", "th"))
                     if not headers:
-                        headers = [c.get_text(strip=True) for c in cells]
+                        headers = [_get_text(c) for c in cells]
                         continue
                     if len(cells) >= 2:
                         entry = {}
                         for i, cell in enumerate(cells):
                             if i < len(headers):
-                                entry[headers[i]] = cell.get_text(strip=True)
+                                entry[headers[i]] = _get_text(cell)
                         if entry:
                             history.append(entry)
         if history:
@@ -959,9 +1801,8 @@ class Downloader:
 
         # Step 2: Find the matching case from this court complex
         # Filter by court_code that matches the task's court_numbers
-        valid_court_codes = [c.strip() for c in self.task.court_numbers.split(",")]
         matching_cases = [
-            c for c in case_list if c.get("court_code") in valid_court_codes
+            c for c in case_list if c.get("court_code") in self._valid_court_codes
         ]
 
         # Use court-filtered cases if available, otherwise all cases
@@ -972,12 +1813,23 @@ class Downloader:
             order_petitioner = (order_data.get("petitioner") or "").lower().strip()
             order_respondent = (order_data.get("respondent") or "").lower().strip()
             order_parties = (order_data.get("parties") or "").lower().strip()
+            # Same for every candidate, so normalize "vs" variations once
+            order_norm = _normalize_parties(order_parties)
 
-            def parties_match(case_info: dict) -> bool:
-                """Check if case party names match order party names"""
-                case_petitioner = (case_info.get("petitioner") or "").lower().strip()
-                case_respondent = (case_info.get("respondent") or "").lower().strip()
+            def normalized(case_info: dict) -> tuple:
+                """Lower-cased party fields of a candidate, computed once"""
                 case_parties = (case_info.get("parties") or "").lower().strip()
+                return (
+                    case_info,
+                    (case_info.get("petitioner") or "").lower().strip(),
+                    (case_info.get("respondent") or "").lower().strip(),
+                    case_parties,
+                    _normalize_parties(case_parties) if case_parties else "",
+                )
+
+            def parties_match(candidate: tuple) -> bool:
+                """Check if case party names match order party names"""
+                _, case_petitioner, case_respondent, case_parties, case_norm = candidate
 
                 # Try exact match on petitioner/respondent
                 if order_petitioner and case_petitioner:
@@ -996,23 +1848,16 @@ class Downloader:
 
                 # Try matching on combined parties string
                 if order_parties and case_parties:
-                    # Normalize "vs" variations
-                    order_norm = re.sub(
-                        r"\s+",
-                        " ",
-                        order_parties.replace(" vs ", " ").replace(" v/s ", " "),
-                    )
-                    case_norm = re.sub(
-                        r"\s+",
-                        " ",
-                        case_parties.replace(" vs ", " ").replace(" v/s ", " "),
-                    )
                     if order_norm in case_norm or case_norm in order_norm:
                         return True
 
                 return False
 
-            party_matched = [c for c in candidates if parties_match(c)]
+            party_matched = [
+                candidate[0]
+                for candidate in map(normalized, candidates)
+                if parties_match(candidate)
+            ]
             if len(party_matched) == 1:
                 candidates = party_matched
                 logger.debug(
@@ -1040,6 +1885,12 @@ class Downloader:
                 f"using first: CNR={case_info.get('cino')}, court={case_info.get('court_code')}"
             )
 
+        # Orders of the same case resolve to the same CNR; reuse its details
+        cino = case_info.get("cino")
+        if cino in self._case_details_cache:
+            logger.debug(f"Reusing case details for CNR {cino}")
+            return dict(self._case_details_cache[cino])
+
         # Fetch case history for selected case
         html = self.view_case_history(case_info)
         if not html:
@@ -1058,19 +1909,33 @@ class Downloader:
         # Store raw HTML for reference
         details["case_details_html"] = html[:10000]  # Limit size
 
-        return details
+        if cino:
+            self._case_details_cache[cino] = details
+        return dict(details)
 
     def _fetch_with_retry(
-        self, method: str, url: str, max_retries: int = 3, **kwargs
+        self,
+        method: str,
+        url: str,
+        max_retries: int = 3,
+        session: Optional[requests.Session] = None,
+        **kwargs,
     ) -> requests.Response:
-        """Fetch URL with retry logic for network errors"""
+        """
+        Fetch URL with retry logic for network errors, and for 429/503 responses
+        (waiting out Retry-After when the server sends one). Uses the leased
+        session unless another one is given.
+        """
+        if session is None:
+            session = self.session
         last_exception = None
         for attempt in range(max_retries + 1):
+            request_rate_limiter.acquire()
             try:
                 if method == "GET":
-                    return self.session.get(url, **kwargs)
+                    response = session.get(url, **kwargs)
                 else:
-                    return self.session.post(url, **kwargs)
+                    response = session.post(url, **kwargs)
             except (
                 ConnectionError,
                 Timeout,
@@ -1086,25 +1951,98 @@ class Downloader:
                         f"Retrying in {delay:.1f}s..."
                     )
                     time.sleep(delay)
+                    continue
                 else:
                     raise
+
+            if response.status_code in (429, 503) and attempt < max_retries:
+                request_rate_limiter.penalize()
+                delay = min(1.0 * (2**attempt) + random.uniform(0, 1), 30.0)
+                retry_after = response.headers.get("Retry-After", "").strip()
+                if retry_after.isdigit():
+                    delay = min(float(retry_after), MAX_RETRY_AFTER)
+                logger.warning(
+                    f"HTTP {response.status_code} (attempt {attempt + 1}/{max_retries + 1}). "
+                    f"Retrying in {delay:.1f}s..."
+                )
+                response.close()
+                time.sleep(delay)
+                continue
+            if response.status_code < 400:
+                request_rate_limiter.recover()
+            return response
         raise last_exception
 
+    def _fetch_pdf_bytes(
+        self, url: str, cookies: dict, max_retries: int = 3
+    ) -> Optional[bytes]:
+        """
+        Stream a PDF body into a single bytes object, retrying the whole GET on
+        network errors mid-body (a streamed read happens outside _fetch_with_retry).
+        Returns None for non-200 responses, and for bodies that do not start with
+        the PDF magic (an HTML error page), without reading the rest of them.
+
+        Runs on PDF worker threads, so it uses the thread's own session with the
+        given cookies rather than the leased session the task thread is using.
+        """
+        session = session_pool.pdf_session()
+        for attempt in range(max_retries + 1):
+            response = self._fetch_with_retry(
+                "GET", url, session=session, cookies=cookies, timeout=120, stream=True
+            )
+            try:
+                with response:
+                    if response.status_code != 200:
+                        return None
+                    chunks = response.iter_content(chunk_size=1 << 16)
+                    head = b""
+                    for chunk in chunks:
+                        head += chunk
+                        if len(head) >= 4:
+                            break
+                    if head[:4] != b"%PDF":
+                        logger.debug(f"Response is not a PDF: {head[:50]}")
+                        return None
+                    return b"".join((head, *chunks))
+            except (
+                ConnectionError,
+                ChunkedEncodingError,
+                urllib3.exceptions.ProtocolError,
+            ) as e:
+                if attempt == max_retries:
+                    raise
+                delay = min(1.0 * (2**attempt) + random.uniform(0, 1), 30.0)
+                logger.warning(
+                    f"PDF read failed (attempt {attempt + 1}/{max_retries + 1}): {e}. "
+                    f"Retrying in {delay:.1f}s..."
+                )
+                time.sleep(delay)
+            finally:
+                # Nothing a PDF response sets may reach another task's GETs
+                session.cookies.clear()
+        return None
+
     def download_pdf(self, order_data: dict) -> Optional[bytes]:
         """Download PDF for an order using displayPdf parameters"""
+        pdf_url = self.resolve_pdf_url(order_data)
+        if not pdf_url:
+            return None
+        return self._get_pdf(pdf_url, self.session.cookies.get_dict())
+
+    def resolve_pdf_url(self, order_data: dict) -> Optional[str]:
+        """Ask display_pdf for the URL of an order's PDF"""
         onclick = order_data.get("onclick", "")
 
-        # Extract displayPdf parameters: displayPdf('normal_v','case_val','court_code','filename','appFlag')
-        pattern = r"displayPdf\s*\(\s*'([^']+)'\s*,\s*'([^']+)'\s*,\s*'([^']+)'\s*,\s*'([^']+)'\s*,\s*'([^']*)'\s*\)"
-        match = re.search(pattern, onclick)
+        # Extract displayPdf parameters
+        args = _parse_display_pdf(onclick)
 
-        if not match:
+        if not args:
             logger.debug(
                 f"Could not extract displayPdf parameters from: {onclick[:100]}"
             )
             return None
 
-        normal_v, case_val, court_code, filename, app_flag = match.groups()
+        normal_v, case_val, court_code, filename, app_flag = args
 
         # Call the display_pdf endpoint to get PDF URL
         url = f"{BASE_URL}?p=home/display_pdf"
@@ -1119,12 +2057,10 @@ class Downloader:
         }
 
         try:
-            response = self._fetch_with_retry(
-                "POST", url, data=data, timeout=60, verify=False
-            )
+            response = self._fetch_with_retry("POST", url, data=data, timeout=60)
             response.raise_for_status()
 
-            result = response.json()
+            result = json.loads(response.content)
             self._update_token(result)
 
             # Get PDF URL from response (presence of 'order' indicates success)
@@ -1135,59 +2071,45 @@ class Downloader:
 
             # Make URL absolute
             if not pdf_path.startswith("http"):
-                pdf_url = f"{BASE_URL}{pdf_path.lstrip('/')}"
-            else:
-                pdf_url = pdf_path
+                return f"{BASE_URL}{pdf_path.lstrip('/')}"
+            return pdf_path
 
-            # Download the actual PDF with retry
-            pdf_response = self._fetch_with_retry(
-                "GET", pdf_url, timeout=120, verify=False
-            )
-            if pdf_response.status_code == 200 and len(pdf_response.content) > 100:
-                # Verify it's a PDF
-                if pdf_response.content[:4] == b"%PDF":
-                    return pdf_response.content
-                else:
-                    logger.debug(f"Response is not a PDF: {pdf_response.content[:50]}")
-                    return None
-
-        except json.JSONDecodeError:
+        except ValueError:
             logger.debug(f"Non-JSON response from display_pdf: {response.text[:100]}")
         except Exception as e:
             logger.error(f"Error downloading PDF: {e}")
 
         return None
 
+    def _get_pdf(self, pdf_url: str, cookies: dict) -> Optional[bytes]:
+        """Download the actual PDF with retry, returning it only if it looks valid"""
+        try:
+            # _fetch_pdf_bytes has already checked the %PDF magic
+            pdf_content = self._fetch_pdf_bytes(pdf_url, cookies)
+            if pdf_content is not None and len(pdf_content) > 100:
+                return pdf_content
+
+        except Exception as e:
+            logger.error(f"Error downloading PDF: {e}")
+
+        return None
+
     def _compress_pdf_bytes(self, pdf_content: bytes) -> bytes:
         """
-        Compress PDF content (bytes) using Ghostscript.
+        Compress PDF content (bytes) using the selected compressor.
         Returns compressed bytes if successful, original bytes otherwise.
         """
-        import tempfile
-
         try:
-            # Write to temp file
-            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp_in:
-                tmp_in.write(pdf_content)
-                tmp_in_path = Path(tmp_in.name)
-
             original_size = len(pdf_content)
-
-            # Compress the PDF
-            compressed_path = compress_pdf_if_enabled(
-                tmp_in_path, COMPRESSION_AVAILABLE
-            )
-
-            # Read the result
-            with open(compressed_path, "rb") as f:
-                result_content = f.read()
-
+            with _compress_slots:
+                if PDF_COMPRESSOR == "qpdf":
+                    result_content = qpdf.compress_pdf_bytes(pdf_content)
+                else:
+                    result_content = compress_pdf_bytes(
+                        pdf_content, PDF_COMPRESSION_LEVEL
+                    )
             compressed_size = len(result_content)
 
-            # Clean up temp file
-            if tmp_in_path.exists():
-                tmp_in_path.unlink()
-
             # Log compression result
             if compressed_size < original_size:
                 reduction = (1 - compressed_size / original_size) * 100
@@ -1201,8 +2123,105 @@ class Downloader:
             logger.debug(f"PDF compression failed: {e}")
             return pdf_content
 
+    def _archive_has(self, year: int, names: List[tuple]) -> List[bool]:
+        """
+        Check (archive_type, filename) pairs against the archive in one call,
+        counting entries still buffered or queued here as present
+        """
+        found = [(t, year, f) in self._queued_files for t, f in names]
+        if all(found):
+            return found
+        exists = self.archive_manager.files_exist(
+            year,
+            self.task.state_code,
+            self.task.district_code,
+            self.task.complex_code,
+            names,
+        )
+        return [q or e for q, e in zip(found, exists)]
+
+    def _buffer_archive_write(
+        self, year: int, archive_type: str, filename: str, content: bytes | str
+    ):
+        """Buffer an archive entry, writing the batch once it is full"""
+        self._queued_files.add((archive_type, year, filename))
+        self._archive_buffer.append(
+            (
+                year,
+                self.task.state_code,
+                self.task.district_code,
+                self.task.complex_code,
+                archive_type,
+                filename,
+                content,
+            )
+        )
+        if len(self._archive_buffer) >= ARCHIVE_BATCH_SIZE:
+            self.flush_archive_writes()
+
+    def flush_archive_writes(self):
+        """Write buffered archive entries in one batch"""
+        entries, self._archive_buffer = self._archive_buffer, []
+        if entries:
+            self.archive_manager.add_many(entries)
+
+    def _fetch_and_store(
+        self, year: int, pdf_filename: str, pdf_url: str, cookies: dict
+    ) -> bool:
+        """Download a PDF, compress it if enabled and add it to the archive"""
+        pdf_content = self._get_pdf(pdf_url, cookies)
+        if not pdf_content:
+            # Let a later order with the same CNR try again
+            self._queued_files.discard(("orders", year, pdf_filename))
+            return False
+
+        if self.compress_pdfs:
+            pdf_content = self._compress_pdf_bytes(pdf_content)
+        self.archive_manager.add_to_archive(
+            year,
+            self.task.state_code,
+            self.task.district_code,
+            self.task.complex_code,
+            "orders",
+            pdf_filename,
+            pdf_content,
+        )
+        with self._stored_pdfs_lock:
+            self._stored_pdfs += 1
+        return True
+
+    def _queue_pdf_fetch(self, year: int, pdf_filename: str, pdf_url: str):
+        """Fetch and store a PDF in the background, bounding how many are queued"""
+        self._queued_files.add(("orders", year, pdf_filename))
+        if len(self._pending_writes) >= MAX_PENDING_PDF_WRITES:
+            # Free a slot as soon as any fetch finishes, not just the oldest
+            done, pending = concurrent.futures.wait(
+                self._pending_writes,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            for future in done:
+                future.result()
+            self._pending_writes = list(pending)
+        # The leased session stays with the task thread; the fetch gets a copy
+        # of its cookies instead
+        cookies = self.session.cookies.get_dict()
+        self._pending_writes.append(
+            _pdf_executor.submit(
+                self._fetch_and_store, year, pdf_filename, pdf_url, cookies
+            )
+        )
+
+    def flush_pdf_writes(self):
+        """Wait for queued PDF writes, re-raising the first failure"""
+        pending, self._pending_writes = self._pending_writes, []
+        for future in pending:
+            future.result()
+
     def process_order(self, order_data: dict) -> bool:
-        """Process a single order - download PDF and save metadata"""
+        """
+        Process a single order - save metadata and queue the PDF download.
+        Returns True if a PDF fetch was queued.
+        """
         cnr = order_data.get("cnr", "")
 
         # Fetch detailed case information if enabled
@@ -1234,16 +2253,13 @@ class Downloader:
         except (ValueError, KeyError, AttributeError):
             year = datetime.now().year
 
-        # Check if metadata already exists
+        # Check if metadata and PDF already exist
         metadata_filename = f"{cnr}.json"
-        if not self.archive_manager.file_exists(
-            year,
-            self.task.state_code,
-            self.task.district_code,
-            self.task.complex_code,
-            "metadata",
-            metadata_filename,
-        ):
+        pdf_filename = f"{cnr}.pdf"
+        has_metadata, has_pdf = self._archive_has(
+            year, [("metadata", metadata_filename), ("orders", pdf_filename)]
+        )
+        if not has_metadata:
             # Save metadata
             metadata = {
                 "cnr": cnr,
@@ -1271,42 +2287,19 @@ class Downloader:
                     if key not in internal_case_fields and key not in metadata:
                         metadata[key] = value
 
-            self.archive_manager.add_to_archive(
+            self._buffer_archive_write(
                 year,
-                self.task.state_code,
-                self.task.district_code,
-                self.task.complex_code,
                 "metadata",
                 metadata_filename,
-                json.dumps(metadata, indent=2, ensure_ascii=False),
+                _METADATA_ENCODER.encode(metadata).encode("utf-8"),
             )
 
-        # Check if PDF already exists
-        pdf_filename = f"{cnr}.pdf"
-        if not self.archive_manager.file_exists(
-            year,
-            self.task.state_code,
-            self.task.district_code,
-            self.task.complex_code,
-            "orders",
-            pdf_filename,
-        ):
-            # Download PDF
-            pdf_content = self.download_pdf(order_data)
-            if pdf_content:
-                # Compress PDF if enabled
-                if self.compress_pdfs:
-                    pdf_content = self._compress_pdf_bytes(pdf_content)
-
-                self.archive_manager.add_to_archive(
-                    year,
-                    self.task.state_code,
-                    self.task.district_code,
-                    self.task.complex_code,
-                    "orders",
-                    pdf_filename,
-                    pdf_content,
-                )
+        if not has_pdf:
+            # Resolve the PDF URL in the session, then download, compress and
+            # store it in the background while the next order is processed
+            pdf_url = self.resolve_pdf_url(order_data)
+            if pdf_url:
+                self._queue_pdf_fetch(year, pdf_filename, pdf_url)
                 return True
 
         return False
@@ -1316,21 +2309,21 @@ class Downloader:
         # Check if task already completed (BEFORE hitting the server)
         if is_task_completed(self.task):
             logger.debug(f"Skipping already completed task: {self.task}")
+            self.release_session()
             return
 
         try:
-            self.init_session()
-
-            # Set court data
-            if not self.set_court_data():
+            # Reuse or initialize the session and set court data
+            if not self.prepare_session():
                 logger.error(f"Failed to set court data for task: {self.task}")
                 return
 
             # Search for orders
             html = self.search_orders()
-            if not html:
-                logger.debug(f"No results for task: {self.task}")
-                # Mark as completed even if no results (so we don't retry)
+            if html is None:
+                logger.debug(f"Search failed for task: {self.task}")
+                # Mark as completed (so we don't retry), but a failed search says
+                # nothing about whether the range is empty
                 save_completed_task(get_task_key(self.task))
                 return
 
@@ -1340,12 +2333,13 @@ class Downloader:
                 logger.debug(f"No orders found for task: {self.task}")
                 # Mark as completed even if no orders
                 save_completed_task(get_task_key(self.task))
+                save_empty_task(self.task)
                 return
 
             logger.info(f"Found {len(orders)} orders for task: {self.task}")
 
             # Process each order with progress bar
-            downloaded = 0
+            queued = 0
             pbar = tqdm(
                 orders,
                 desc=f"PDFs ({self.task.complex_name[:20]})",
@@ -1354,19 +2348,39 @@ class Downloader:
             )
             for order in pbar:
                 if self.process_order(order):
-                    downloaded += 1
-                    pbar.set_postfix({"new": downloaded})
+                    queued += 1
+                    pbar.set_postfix({"queued": queued})
+
+            # Wait for every archive write before marking the task completed; a
+            # write that raised fails the task here. A PDF that could not be
+            # fetched is only logged, as when orders were processed inline.
+            self.flush_archive_writes()
+            self.flush_pdf_writes()
 
             logger.info(
-                f"Downloaded {downloaded} new PDFs out of {len(orders)} orders for task: {self.task}"
+                f"Downloaded {self._stored_pdfs} new PDFs out of {len(orders)} orders for task: {self.task}"
             )
 
             # Mark task as completed
             save_completed_task(get_task_key(self.task))
 
-        except Exception as e:
-            logger.error(f"Error processing task {self.task}: {e}")
-            traceback.print_exc()
+        except Exception:
+            logger.exception(f"Error processing task {self.task}")
+        finally:
+            try:
+                self.flush_archive_writes()
+            except Exception as e:
+                logger.error(f"Error writing archive entries for task {self.task}: {e}")
+            concurrent.futures.wait(self._pending_writes)
+            self._pending_writes = []
+            self.release_session()
+
+    def release_session(self):
+        """Return this downloader's session to the pool"""
+        if self._state is not None:
+            self._captcha_prefetcher.cancel()
+            session_pool.release(self._pool_key, self._state)
+            self._state = None
 
 
 def process_task(
@@ -1378,9 +2392,13 @@ def process_task(
     try:
         downloader = Downloader(task, archive_manager, compress_pdfs=compress_pdfs)
         downloader.download()
-    except Exception as e:
-        logger.error(f"Error processing task {task}: {e}")
-        traceback.print_exc()
+    except Exception:
+        logger.exception(f"Error processing task {task}")
+
+
+# Set to make run() stop submitting tasks (e.g. sync_s3_fill's timeout); tasks
+# already submitted still finish and are recorded as completed
+stop_requested = threading.Event()
 
 
 def run(
@@ -1391,8 +2409,13 @@ def run(
     max_workers: int = 5,
     archive_manager: Optional[S3ArchiveManager] = None,
     compress_pdfs: bool = True,
+    skip_known_empty: bool = False,
+    download_workers: Optional[int] = None,
 ):
-    """Run the downloader for all courts and date ranges"""
+    """
+    Run the downloader for all courts and date ranges. With skip_known_empty,
+    tasks whose months all searched empty before are skipped without a search.
+    """
     # Create archive manager if not provided
     if archive_manager is None:
         archive_manager = S3ArchiveManager(
@@ -1402,32 +2425,64 @@ def run(
             local_only=True,
         )
 
-    # Generate tasks
-    tasks = list(generate_tasks(courts, start_date, end_date, day_step))
-    logger.info(f"Generated {len(tasks)} tasks")
+    if download_workers:
+        set_pdf_workers(download_workers)
 
-    # Process tasks
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [
-            executor.submit(process_task, task, archive_manager, compress_pdfs)
-            for task in tasks
-        ]
+    # Every task thread, PDF worker and captcha worker may hold a connection
+    session_pool.set_pool_size(max(64, max_workers + PDF_WORKERS + CAPTCHA_WORKERS))
 
-        for i, future in enumerate(
-            tqdm(
-                concurrent.futures.as_completed(futures),
-                total=len(futures),
-                desc="Processing tasks",
-            )
-        ):
+    # Count tasks without materializing them
+    num_ranges = count_date_ranges(start_date, end_date, day_step)
+    total_tasks = num_ranges * len(courts)
+    logger.info(f"Generated {total_tasks} tasks")
+
+    # Stream tasks through the pool, keeping at most a few per worker in flight
+    # so memory stays flat however many years x courts are requested. Worker
+    # threads are enough here: requests and onnxruntime both release the GIL
+    # while waiting, and the server rate-limits well below where threads cost.
+    max_in_flight = max_workers * 2
+    in_flight = set()
+
+    def collect(done):
+        for future in done:
             try:
                 future.result()
             except Exception as e:
                 logger.error(f"Task failed: {e}")
+            pbar.update(1)
 
+    with (
+        concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor,
+        tqdm(total=total_tasks, desc="Processing tasks") as pbar,
+    ):
+        for task in generate_tasks(courts, start_date, end_date, day_step):
+            if stop_requested.is_set():
+                logger.info("Stop requested, not submitting further tasks")
+                break
+            if is_task_completed(task) or (
+                skip_known_empty and is_task_known_empty(task)
+            ):
+                pbar.update(1)
+                continue
+            if len(in_flight) >= max_in_flight:
+                done, in_flight = concurrent.futures.wait(
+                    in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                collect(done)
+            in_flight.add(
+                executor.submit(process_task, task, archive_manager, compress_pdfs)
+            )
+
+        collect(concurrent.futures.as_completed(in_flight))
+
+    compact_completed_tasks()
     logger.info("All tasks completed")
 
 
+# CourtComplex fields that can be filtered on from the command line
+COURT_FILTER_FIELDS = ("state_code", "district_code", "complex_code")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Download Indian District Court Judgments"
@@ -1457,23 +2512,18 @@ def main():
         help="Number of parallel workers (default: 2 to avoid rate limiting)",
     )
     parser.add_argument(
-        "--state_code",
-        type=str,
-        default=None,
-        help="Filter by state code",
-    )
-    parser.add_argument(
-        "--district_code",
-        type=str,
-        default=None,
-        help="Filter by district code",
-    )
-    parser.add_argument(
-        "--complex_code",
-        type=str,
-        default=None,
-        help="Filter by complex code",
+        "--download_workers",
+        type=int,
+        default=PDF_WORKERS,
+        help=f"Number of parallel PDF downloads across all workers (default: {PDF_WORKERS})",
     )
+    for name in COURT_FILTER_FIELDS:
+        parser.add_argument(
+            f"--{name}",
+            type=str,
+            default=None,
+            help=f"Filter by {name.replace('_', ' ')}",
+        )
     parser.add_argument(
         "--courts_csv",
         type=str,
@@ -1504,6 +2554,18 @@ def main():
         default=False,
         help="Disable PDF compression (compression is enabled by default)",
     )
+    parser.add_argument(
+        "--compressor",
+        choices=sorted(PDF_COMPRESSOR_NAMES),
+        default="gs",
+        help="PDF compressor: gs (Ghostscript, smallest output for scans) or qpdf (lossless, in-process, needs pikepdf)",
+    )
+    parser.add_argument(
+        "--compress-level",
+        choices=["screen", "ebook", "printer", "prepress"],
+        default="screen",
+        help="Ghostscript preset: screen (72 dpi images, smallest) to prepress (300 dpi)",
+    )
     parser.add_argument(
         "--upload-local",
         action="store_true",
@@ -1521,11 +2583,12 @@ def main():
     # Handle PDF compression settings
     compress_pdfs = not args.no_compress
     if compress_pdfs:
-        if COMPRESSION_AVAILABLE:
-            logger.info("PDF compression enabled (using Ghostscript)")
+        compressor = PDF_COMPRESSOR_NAMES[args.compressor]
+        if set_pdf_compressor(args.compressor, args.compress_level):
+            logger.info(f"PDF compression enabled (using {compressor})")
         else:
             logger.warning(
-                "PDF compression requested but Ghostscript not available - compression disabled"
+                f"PDF compression requested but {compressor} not available - compression disabled"
             )
             compress_pdfs = False
     else:
@@ -1542,12 +2605,9 @@ def main():
     logger.info(f"Loaded {len(courts)} court complexes")
 
     # Apply filters
-    if args.state_code:
-        courts = [c for c in courts if c.state_code == args.state_code]
-    if args.district_code:
-        courts = [c for c in courts if c.district_code == args.district_code]
-    if args.complex_code:
-        courts = [c for c in courts if c.complex_code == args.complex_code]
+    courts = filter_courts(
+        courts, **{name: getattr(args, name) for name in COURT_FILTER_FIELDS}
+    )
 
     if not courts:
         logger.error("No courts match the specified filters")
@@ -1579,6 +2639,7 @@ def main():
             end_date=args.end_date,
             day_step=args.day_step,
             max_workers=args.max_workers,
+            download_workers=args.download_workers,
             timeout_hours=args.timeout_hours,
             compress_pdfs=compress_pdfs,
         )
@@ -1594,6 +2655,7 @@ def main():
             end_date=args.end_date,
             day_step=args.day_step,
             max_workers=args.max_workers,
+            download_workers=args.download_workers,
             compress_pdfs=compress_pdfs,
         )
     else:
@@ -1616,6 +2678,7 @@ def main():
                 end_date=end_date,
                 day_step=args.day_step,
                 max_workers=args.max_workers,
+                download_workers=args.download_workers,
                 archive_manager=archive_manager,
                 compress_pdfs=compress_pdfs,
             )
@@ -46,6 +46,34 @@ root_logger.addHandler(console_handler)
 
 logger = logging.getLogger(__name__)
 
+# Patterns compiled once; the extractors below run for every metadata record
+# metadata/tar/year=YYYY/state=XX/district=YY/complex=ZZ/metadata.tar
+_TAR_KEY_RE = re.compile(r"year=(\d{4})/state=(\w+)/district=(\w+)/complex=(\w+)/")
+# Fallbacks for records without structured fields, tried in order
+_ORDER_DATE_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"Order Date\s*:\s*(\d{2}-\d{2}-\d{4})",
+        r"Decision Date\s*:\s*(\d{2}-\d{2}-\d{4})",
+        r"Date\s*:\s*(\d{2}-\d{2}-\d{4})",
+    )
+)
+_CASE_TYPE_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"Case Type\s*:\s*([^<\n]+)",
+        r"<td[^>]*>([A-Z]+\s*/\s*\d+/\d+)</td>",
+    )
+)
+_PETITIONER_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"Petitioner\s*:\s*([^<\n]+)",
+        r"Appellant\s*:\s*([^<\n]+)",
+    )
+)
+_RESPONDENT_RES = (re.compile(r"Respondent\s*:\s*([^<\n]+)", re.IGNORECASE),)
+
 
 class DistrictCourtMetadataProcessor:
     """Processes metadata from S3 and generates Parquet files"""
@@ -81,10 +109,7 @@ class DistrictCourtMetadataProcessor:
                     continue
 
                 # Parse path: metadata/tar/year=YYYY/state=XX/district=YY/complex=ZZ/metadata.tar
-                match = re.search(
-                    r"year=(\d{4})/state=(\w+)/district=(\w+)/complex=(\w+)/",
-                    key,
-                )
+                match = _TAR_KEY_RE.search(key)
                 if match:
                     year = match.group(1)
                     state = match.group(2)
@@ -113,14 +138,8 @@ class DistrictCourtMetadataProcessor:
     def extract_date_from_html(html: str) -> Optional[str]:
         """Extract order date from raw HTML"""
         # Try various date patterns
-        patterns = [
-            r"Order Date\s*:\s*(\d{2}-\d{2}-\d{4})",
-            r"Decision Date\s*:\s*(\d{2}-\d{2}-\d{4})",
-            r"Date\s*:\s*(\d{2}-\d{2}-\d{4})",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
+        for pattern in _ORDER_DATE_RES:
+            match = pattern.search(html)
             if match:
                 return match.group(1)
 
@@ -129,13 +148,8 @@ class DistrictCourtMetadataProcessor:
     @staticmethod
     def extract_case_type(html: str) -> Optional[str]:
         """Extract case type from raw HTML"""
-        patterns = [
-            r"Case Type\s*:\s*([^<\n]+)",
-            r"<td[^>]*>([A-Z]+\s*/\s*\d+/\d+)</td>",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
+        for pattern in _CASE_TYPE_RES:
+            match = pattern.search(html)
             if match:
                 return match.group(1).strip()
 
@@ -144,13 +158,8 @@ class DistrictCourtMetadataProcessor:
     @staticmethod
     def extract_petitioner(html: str) -> Optional[str]:
         """Extract petitioner name from raw HTML"""
-        patterns = [
-            r"Petitioner\s*:\s*([^<\n]+)",
-            r"Appellant\s*:\s*([^<\n]+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
+        for pattern in _PETITIONER_RES:
+            match = pattern.search(html)
             if match:
                 return match.group(1).strip()
 
@@ -159,12 +168,8 @@ class DistrictCourtMetadataProcessor:
     @staticmethod
     def extract_respondent(html: str) -> Optional[str]:
         """Extract respondent name from raw HTML"""
-        patterns = [
-            r"Respondent\s*:\s*([^<\n]+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
+        for pattern in _RESPONDENT_RES:
+            match = pattern.search(html)
             if match:
                 return match.group(1).strip()
 
@@ -63,6 +63,9 @@ HEADERS = {
     "X-Requested-With": "XMLHttpRequest",
 }
 
+_APP_TOKEN_RE1 = re.compile(r"app_token['\"]?\s*[:=]\s*['\"]([^'\"]+)['\"]")
+_APP_TOKEN_RE2 = re.compile(r"app_token=([^&'\"]+)")
+
 
 class CourtHierarchyScraper:
     """Scrapes the court hierarchy from eCourts website"""
@@ -86,7 +89,7 @@ class CourtHierarchyScraper:
         self.app_token = self._extract_app_token(response.text)
         if not self.app_token:
             # Try to get token from URL
-            token_match = re.search(r"app_token=([^&'\"]+)", response.url)
+            token_match = _APP_TOKEN_RE2.search(response.url)
             if token_match:
                 self.app_token = token_match.group(1)
 
@@ -106,14 +109,12 @@ class CourtHierarchyScraper:
             return token_input.get("value", "")
 
         # Look for app_token in JavaScript
-        pattern = r"app_token['\"]?\s*[:=]\s*['\"]([^'\"]+)['\"]"
-        match = re.search(pattern, html)
+        match = _APP_TOKEN_RE1.search(html)
         if match:
             return match.group(1)
 
         # Look for app_token in URL
-        pattern2 = r"app_token=([^&'\"]+)"
-        match = re.search(pattern2, html)
+        match = _APP_TOKEN_RE2.search(html)
         if match:
             return match.group(1)
 
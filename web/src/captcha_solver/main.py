@@ -13,6 +13,14 @@ logger = logging.getLogger(__name__)
 # Get the directory where this file is located
 _current_dir = Path(__file__).parent
 model_file = str(_current_dir / "captcha.onnx")
+# Optional INT8 copy of the model, roughly 4x smaller and faster on CPU. Not
+# shipped: generate it offline with
+#   onnxruntime.quantization.quantize_dynamic(
+#       "captcha.onnx", "captcha.int8.onnx", weight_type=QuantType.QInt8)
+# and only drop it in here once its solve rate matches the FP32 model.
+int8_model_file = _current_dir / "captcha.int8.onnx"
+if int8_model_file.exists():
+    model_file = str(int8_model_file)
 img_size = (32, 128)
 charset = r"0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ!\"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~"
 tokenizer_base = Tokenizer(charset)
@@ -42,11 +50,15 @@ def initialize_model(model_file):
     onnx_model = onnx.load(model_file)
     onnx.checker.check_model(onnx_model)
     ort_session = rt.InferenceSession(model_file)
+    logger.debug("Loaded captcha model %s", model_file)
     return transform, ort_session
 
 
 def get_text(img_org):
     # img_org = Image.open(image_path)
+    # The exported graph fixes the batch dimension at 1 (its Reshape nodes
+    # hard-code it), so images cannot be stacked into one run; concurrent
+    # callers share the thread-safe ort_session instead.
     # Preprocess. Model expects a batch of images with shape: (B, C, H, W)
     x = transform(img_org.convert("RGB")).unsqueeze(0)
 
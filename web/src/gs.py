@@ -5,7 +5,6 @@ PDF compression utility using Ghostscript.
 import os
 import shutil
 import subprocess
-from pathlib import Path
 
 
 def check_ghostscript_available() -> bool:
@@ -99,40 +98,47 @@ def compress_pdf(
         return False, f"Error during compression: {str(e)}"
 
 
-def compress_pdf_if_enabled(pdf_path: Path, compression_available: bool) -> Path:
+def compress_pdf_bytes(pdf_content: bytes, compression_level: str = "screen") -> bytes:
     """
-    Compress a PDF file if compression is enabled and available.
-    Returns the path to the final PDF (original or compressed).
+    Compress PDF content in memory, piping it through Ghostscript's stdin/stdout
+    instead of round-tripping through temp files.
+
+    Args:
+        pdf_content: The PDF bytes to compress
+        compression_level: Compression level (screen, ebook, printer, prepress, or default)
+
+    Returns:
+        The compressed bytes if smaller, otherwise the original bytes
     """
-    if not compression_available:
-        return pdf_path
+    gs_path = shutil.which("gs") or "/usr/bin/gs"
+    gs_command = [
+        gs_path,
+        "-sDEVICE=pdfwrite",
+        "-dCompatibilityLevel=1.4",
+        f"-dPDFSETTINGS=/{compression_level}",
+        # Store repeated images (court seals, signatures) once per file
+        "-dDetectDuplicateImages=true",
+        "-dNOPAUSE",
+        "-dBATCH",
+        "-dQUIET",
+        # Keep Ghostscript's own messages out of the PDF written to stdout
+        "-sstdout=%stderr",
+        "-sOutputFile=-",
+        "-",
+    ]
 
     try:
-        # Create temporary compressed file
-        compressed_path = pdf_path.with_suffix(".compressed.pdf")
-
-        # Compress the PDF
-        success, message = compress_pdf(pdf_path, compressed_path)
-
-        if success and compressed_path.exists():
-            original_size = pdf_path.stat().st_size
-            compressed_size = compressed_path.stat().st_size
-
-            # Only replace if compressed version is smaller
-            if compressed_size < original_size:
-                # Replace original with compressed version
-                pdf_path.unlink()  # Remove original
-                compressed_path.rename(pdf_path)  # Rename compressed to original name
-                return pdf_path
-            else:
-                # Keep original, remove compressed version
-                compressed_path.unlink()
-                return pdf_path
-        else:
-            # Compression failed, keep original
-            if compressed_path.exists():
-                compressed_path.unlink()
-            return pdf_path
+        result = subprocess.run(
+            gs_command, input=pdf_content, capture_output=True, timeout=120
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return pdf_content
+
+    compressed = result.stdout
+    if result.returncode != 0 or not compressed.startswith(b"%PDF"):
+        return pdf_content
+    if len(compressed) >= len(pdf_content):
+        # No reduction achieved, keep original
+        return pdf_content
+    return compressed
 
-    except Exception:
-        return pdf_path
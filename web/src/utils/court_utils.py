@@ -12,7 +12,7 @@ from typing import List, Optional
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CourtComplex:
     """Represents a court complex"""
 
@@ -41,23 +41,33 @@ def load_courts_csv(csv_path: Path) -> List[CourtComplex]:
     Returns:
         List of CourtComplex objects
     """
-    courts = []
-    with open(csv_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+    fields = (
+        "state_code",
+        "state_name",
+        "district_code",
+        "district_name",
+        "complex_code",
+        "complex_name",
+        "court_numbers",
+        "flag",
+    )
+    with open(csv_path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return []
+        # Resolve column positions once instead of building a dict per row
+        columns = [header.index(field) for field in fields]
+        courts = []
         for row in reader:
-            courts.append(
-                CourtComplex(
-                    state_code=row["state_code"],
-                    state_name=row["state_name"],
-                    district_code=row["district_code"],
-                    district_name=row["district_name"],
-                    complex_code=row["complex_code"],
-                    complex_name=row["complex_name"],
-                    court_numbers=row["court_numbers"],
-                    flag=row["flag"],
-                )
-            )
-    return courts
+            if not row:
+                continue
+            if len(row) < len(header):
+                # Truncated line; DictReader would have filled the gaps with None
+                logger.warning(f"Skipping short row {reader.line_num} in {csv_path}")
+                continue
+            courts.append(CourtComplex(*(row[i] for i in columns)))
+        return courts
 
 
 def save_courts_csv(courts: List[CourtComplex], csv_path: Path):
@@ -115,6 +125,24 @@ def filter_courts_by_district(
     ]
 
 
+def filter_courts(
+    courts: List[CourtComplex],
+    state_code: Optional[str] = None,
+    district_code: Optional[str] = None,
+    complex_code: Optional[str] = None,
+) -> List[CourtComplex]:
+    """Filter courts by any combination of codes in a single pass"""
+    if not (state_code or district_code or complex_code):
+        return courts
+    return [
+        c
+        for c in courts
+        if (not state_code or c.state_code == state_code)
+        and (not district_code or c.district_code == district_code)
+        and (not complex_code or c.complex_code == complex_code)
+    ]
+
+
 def get_court_by_complex(
     courts: List[CourtComplex], state_code: str, district_code: str, complex_code: str
 ) -> Optional[CourtComplex]:
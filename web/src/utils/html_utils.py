@@ -11,6 +11,17 @@ from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
+_VIEW_ORDER_PDF_RE = re.compile(
+    r"viewOrderPdf\s*\(\s*'([^']+)'\s*,\s*'([^']+)'\s*,\s*'([^']+)'\s*,\s*'([^']+)'\s*\)"
+)
+_DOWNLOAD_PDF_RE = re.compile(r"downloadPdf\s*\(\s*'([^']+)'\s*\)")
+_WINDOW_OPEN_RE = re.compile(r"window\.open\s*\(\s*'([^']+)'")
+_FUNCTION_CALL_RE = re.compile(r"(\w+)\s*\(\s*([^)]+)\s*\)")
+_QUOTED_ARG_RE = re.compile(r"'([^']*)'")
+_CNR_RE = re.compile(r"\b([A-Z]{4}\d{12})\b")
+_APP_TOKEN_RE1 = re.compile(r"app_token['\"]?\s*[:=]\s*['\"]([^'\"]+)['\"]")
+_APP_TOKEN_RE2 = re.compile(r"app_token=([^&'\"]+)")
+
 
 def parse_select_options(html: str) -> List[Tuple[str, str]]:
     """
@@ -228,8 +239,7 @@ def extract_pdf_info_from_onclick(onclick: str) -> Optional[Dict]:
         return None
 
     # Pattern 1: viewOrderPdf with parameters
-    pattern1 = r"viewOrderPdf\s*\(\s*'([^']+)'\s*,\s*'([^']+)'\s*,\s*'([^']+)'\s*,\s*'([^']+)'\s*\)"
-    match = re.search(pattern1, onclick)
+    match = _VIEW_ORDER_PDF_RE.search(onclick)
     if match:
         return {
             "cnr": match.group(1),
@@ -239,25 +249,22 @@ def extract_pdf_info_from_onclick(onclick: str) -> Optional[Dict]:
         }
 
     # Pattern 2: downloadPdf with path
-    pattern2 = r"downloadPdf\s*\(\s*'([^']+)'\s*\)"
-    match = re.search(pattern2, onclick)
+    match = _DOWNLOAD_PDF_RE.search(onclick)
     if match:
         return {"pdf_path": match.group(1)}
 
     # Pattern 3: window.open with URL
-    pattern3 = r"window\.open\s*\(\s*'([^']+)'"
-    match = re.search(pattern3, onclick)
+    match = _WINDOW_OPEN_RE.search(onclick)
     if match:
         return {"pdf_url": match.group(1)}
 
     # Pattern 4: Generic function call with quoted arguments
-    pattern4 = r"(\w+)\s*\(\s*([^)]+)\s*\)"
-    match = re.search(pattern4, onclick)
+    match = _FUNCTION_CALL_RE.search(onclick)
     if match:
         func_name = match.group(1)
         args_str = match.group(2)
         # Extract quoted arguments
-        args = re.findall(r"'([^']*)'", args_str)
+        args = _QUOTED_ARG_RE.findall(args_str)
         return {"function": func_name, "args": args}
 
     return None
@@ -275,8 +282,7 @@ def extract_cnr_from_html(html: str) -> Optional[str]:
     """
     # Pattern: CNR is typically a 16-character alphanumeric code
     # Format: XXYY123456789012 where XX=state, YY=district
-    pattern = r"\b([A-Z]{4}\d{12})\b"
-    match = re.search(pattern, html)
+    match = _CNR_RE.search(html)
     if match:
         return match.group(1)
     return None
@@ -299,14 +305,12 @@ def parse_app_token(html: str) -> Optional[str]:
         return token_input.get("value", "")
 
     # Look for app_token in JavaScript
-    pattern = r"app_token['\"]?\s*[:=]\s*['\"]([^'\"]+)['\"]"
-    match = re.search(pattern, html)
+    match = _APP_TOKEN_RE1.search(html)
     if match:
         return match.group(1)
 
     # Look for app_token in URL
-    pattern2 = r"app_token=([^&'\"]+)"
-    match = re.search(pattern2, html)
+    match = _APP_TOKEN_RE2.search(html)
     if match:
         return match.group(1)
 
@@ -3,9 +3,12 @@ S3 Sync Module for District Court Judgments
 Handles syncing with S3 and incremental downloads
 """
 
+import functools
 import json
 import logging
 import tarfile
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Optional
@@ -19,16 +22,37 @@ from src.utils.court_utils import CourtComplex
 logger = logging.getLogger(__name__)
 
 
+# Concurrent object reads when scanning indexes / metadata TARs. boto3 clients
+# are thread-safe; the connection pool is sized to match.
+S3_READ_WORKERS = 16
+
+
+@functools.cache
+def _s3_client():
+    """Anonymous read client, built once and shared by every scan and thread"""
+    return boto3.client(
+        "s3",
+        config=Config(
+            signature_version=UNSIGNED, max_pool_connections=S3_READ_WORKERS
+        ),
+    )
+
+
+def _latest(dates) -> Optional[datetime]:
+    """Most recent of the non-None dates, or None"""
+    return max((d for d in dates if d is not None), default=None)
+
+
 def get_latest_index_date(s3_bucket: str, state_code: str) -> Optional[datetime]:
     """
     Get the latest updated_at date from index files for a state.
     Returns the most recent date across all districts/complexes.
     """
-    s3 = boto3.client("s3", config=Config(signature_version=UNSIGNED))
+    s3 = _s3_client()
 
-    latest_date = None
     prefix = f"metadata/tar/"
 
+    keys = []
     paginator = s3.get_paginator("list_objects_v2")
     for page in paginator.paginate(Bucket=s3_bucket, Prefix=prefix):
         if "Contents" not in page:
@@ -43,21 +67,24 @@ def get_latest_index_date(s3_bucket: str, state_code: str) -> Optional[datetime]
             if f"/state={state_code}/" not in key:
                 continue
 
-            try:
-                response = s3.get_object(Bucket=s3_bucket, Key=key)
-                index_data = json.loads(response["Body"].read().decode("utf-8"))
+            keys.append(key)
 
-                if "updated_at" in index_data:
-                    updated_at = datetime.fromisoformat(
-                        index_data["updated_at"].replace("Z", "+00:00")
-                    )
-                    if latest_date is None or updated_at > latest_date:
-                        latest_date = updated_at
+    def read_updated_at(key: str) -> Optional[datetime]:
+        try:
+            response = s3.get_object(Bucket=s3_bucket, Key=key)
+            index_data = json.loads(response["Body"].read().decode("utf-8"))
 
-            except Exception as e:
-                logger.debug(f"Could not read index {key}: {e}")
+            if "updated_at" in index_data:
+                return datetime.fromisoformat(
+                    index_data["updated_at"].replace("Z", "+00:00")
+                )
 
-    return latest_date
+        except Exception as e:
+            logger.debug(f"Could not read index {key}: {e}")
+        return None
+
+    with ThreadPoolExecutor(max_workers=S3_READ_WORKERS) as executor:
+        return _latest(executor.map(read_updated_at, keys))
 
 
 def get_latest_metadata_date_from_tar(
@@ -66,12 +93,12 @@ def get_latest_metadata_date_from_tar(
     """
     Fall back to parsing metadata TAR files to find the latest order date.
     """
-    s3 = boto3.client("s3", config=Config(signature_version=UNSIGNED))
+    s3 = _s3_client()
 
-    latest_date = None
     current_year = datetime.now().year
     prefix = f"metadata/tar/year={current_year}/state={state_code}/"
 
+    keys = []
     paginator = s3.get_paginator("list_objects_v2")
     for page in paginator.paginate(Bucket=s3_bucket, Prefix=prefix):
         if "Contents" not in page:
@@ -79,45 +106,49 @@ def get_latest_metadata_date_from_tar(
 
         for obj in page["Contents"]:
             key = obj["Key"]
-            if not key.endswith("metadata.tar"):
-                continue
-
-            # Download and parse
-            import tempfile
-
-            with tempfile.NamedTemporaryFile(suffix=".tar", delete=False) as tmp:
-                tmp_path = Path(tmp.name)
+            if key.endswith("metadata.tar"):
+                keys.append(key)
 
-            try:
-                s3.download_file(s3_bucket, key, str(tmp_path))
+    def latest_in_tar(key: str) -> Optional[datetime]:
+        latest_date = None
 
-                with tarfile.open(tmp_path, "r") as tf:
-                    for member in tf.getmembers():
-                        if not member.name.endswith(".json"):
-                            continue
+        # Download and parse
+        with tempfile.NamedTemporaryFile(suffix=".tar", delete=False) as tmp:
+            tmp_path = Path(tmp.name)
 
-                        f = tf.extractfile(member)
-                        if not f:
-                            continue
+        try:
+            s3.download_file(s3_bucket, key, str(tmp_path))
+
+            with tarfile.open(tmp_path, "r") as tf:
+                for member in tf.getmembers():
+                    if not member.name.endswith(".json"):
+                        continue
+
+                    f = tf.extractfile(member)
+                    if not f:
+                        continue
+
+                    try:
+                        data = json.load(f)
+                        scraped_at = data.get("scraped_at", "")
+                        if scraped_at:
+                            dt = datetime.fromisoformat(
+                                scraped_at.replace("Z", "+00:00")
+                            )
+                            if latest_date is None or dt > latest_date:
+                                latest_date = dt
+                    except Exception:
+                        pass
 
-                        try:
-                            data = json.load(f)
-                            scraped_at = data.get("scraped_at", "")
-                            if scraped_at:
-                                dt = datetime.fromisoformat(
-                                    scraped_at.replace("Z", "+00:00")
-                                )
-                                if latest_date is None or dt > latest_date:
-                                    latest_date = dt
-                        except Exception:
-                            pass
+        except Exception as e:
+            logger.debug(f"Could not process {key}: {e}")
+        finally:
+            tmp_path.unlink(missing_ok=True)
 
-            except Exception as e:
-                logger.debug(f"Could not process {key}: {e}")
-            finally:
-                tmp_path.unlink(missing_ok=True)
+        return latest_date
 
-    return latest_date
+    with ThreadPoolExecutor(max_workers=S3_READ_WORKERS) as executor:
+        return _latest(executor.map(latest_in_tar, keys))
 
 
 def run_sync_s3(
@@ -130,6 +161,7 @@ def run_sync_s3(
     day_step: int,
     max_workers: int,
     compress_pdfs: bool = True,
+    download_workers: Optional[int] = None,
 ):
     """
     Run the sync-s3 operation: check latest date in S3 and download new data.
@@ -199,6 +231,7 @@ def run_sync_s3(
                 end_date=actual_end,
                 day_step=day_step,
                 max_workers=max_workers,
+                download_workers=download_workers,
                 archive_manager=archive_manager,
                 compress_pdfs=compress_pdfs,
             )
@@ -243,11 +276,8 @@ def run_sync_s3(
             else:
                 logger.warning("No new records were processed to parquet")
 
-        except Exception as e:
-            logger.error(f"Error processing metadata to parquet: {e}")
-            import traceback
-
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error processing metadata to parquet")
     else:
         logger.info("No new data to process to parquet format")
 
@@ -9,7 +9,7 @@ Run repeatedly to complete all chunks from 1950 to present.
 import json
 import logging
 import signal
-import time
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Optional
@@ -97,27 +97,56 @@ def update_tracking(chunk_end: str):
 
 
 class GracefulExit:
-    """Handle graceful exit on timeout"""
+    """
+    Handle graceful exit on timeout. The deadline is a one-shot SIGALRM timer,
+    so it also fires in the middle of a chunk; stop_event (if given) is set
+    along with should_exit so the downloader stops submitting tasks. Call
+    disarm() once the run is over.
+    """
 
-    def __init__(self, timeout_hours: float):
+    def __init__(
+        self, timeout_hours: float, stop_event: Optional[threading.Event] = None
+    ):
         self.should_exit = False
-        self.start_time = time.time()
         self.timeout_seconds = timeout_hours * 3600
+        self.stop_event = stop_event
+        if stop_event is not None:
+            # Left set by an earlier run in this process
+            stop_event.clear()
 
         # Set up signal handlers
         signal.signal(signal.SIGTERM, self._handle_signal)
         signal.signal(signal.SIGINT, self._handle_signal)
+        if self.timeout_seconds <= 0:
+            # setitimer(0) would mean no deadline; the budget is already spent
+            logger.info("Timeout is not positive, exiting without processing")
+            self._exit()
+            return
+        signal.signal(signal.SIGALRM, self._handle_timeout)
+        signal.setitimer(signal.ITIMER_REAL, self.timeout_seconds)
+
+    def disarm(self):
+        """Cancel the pending timeout and clear stop_event once the run is over"""
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        if self.stop_event is not None:
+            # Later run() calls in this process must not stop straight away
+            self.stop_event.clear()
+
+    def _exit(self):
+        self.should_exit = True
+        if self.stop_event is not None:
+            self.stop_event.set()
 
     def _handle_signal(self, signum, frame):
         logger.info(f"Received signal {signum}, initiating graceful exit...")
-        self.should_exit = True
+        self._exit()
+
+    def _handle_timeout(self, signum, frame):
+        logger.info(f"Timeout of {self.timeout_seconds / 3600:.1f} hours exceeded")
+        self._exit()
 
     def check_timeout(self) -> bool:
-        """Check if timeout has been exceeded"""
-        elapsed = time.time() - self.start_time
-        if elapsed >= self.timeout_seconds:
-            logger.info(f"Timeout of {self.timeout_seconds / 3600:.1f} hours exceeded")
-            self.should_exit = True
+        """Check if timeout has been exceeded (or an exit signal received)"""
         return self.should_exit
 
 
@@ -132,6 +161,7 @@ def sync_s3_fill_gaps(
     max_workers: int,
     timeout_hours: float = 5.5,
     compress_pdfs: bool = True,
+    download_workers: Optional[int] = None,
 ):
     """
     Fill historical gaps in S3 data.
@@ -141,11 +171,11 @@ def sync_s3_fill_gaps(
     Automatically resumes from where it left off.
     """
     from archive_manager import S3ArchiveManager
-    from download import run
+    from download import run, stop_requested
     from process_metadata import DistrictCourtMetadataProcessor
 
     # Set up graceful exit handler
-    graceful_exit = GracefulExit(timeout_hours)
+    graceful_exit = GracefulExit(timeout_hours, stop_event=stop_requested)
 
     # Track all changes across chunks for final parquet processing
     all_years_processed = set()
@@ -153,80 +183,91 @@ def sync_s3_fill_gaps(
     total_files_uploaded = 0
 
     # Process chunks until timeout or complete
-    while True:
-        # Check for timeout
-        if graceful_exit.check_timeout():
-            logger.info("Timeout reached, stopping...")
-            break
-
-        # Get next chunk to process
-        chunk = get_next_chunk(start_date, end_date)
-        if chunk is None:
-            logger.info("Historical backfill complete!")
-            break
-
-        # Only use provided dates for first chunk
-        start_date = None
-        end_date = None
-
-        chunk_start, chunk_end = chunk
-        logger.info(f"Processing chunk: {chunk_start} to {chunk_end}")
-
-        chunk_has_data = False
-
-        try:
-            with S3ArchiveManager(
-                s3_bucket, s3_prefix, local_dir, immediate_upload=True
-            ) as archive_manager:
-                # Run the downloader
-                logger.info(f"Downloading data for {chunk_start} to {chunk_end}...")
-
-                run(
-                    courts=courts,
-                    start_date=chunk_start,
-                    end_date=chunk_end,
-                    day_step=day_step,
-                    max_workers=max_workers,
-                    archive_manager=archive_manager,
-                    compress_pdfs=compress_pdfs,
-                )
-
-                all_changes = archive_manager.get_all_changes()
-
-                if all_changes:
-                    chunk_has_data = True
-                    for location, archives in all_changes.items():
-                        for archive_type, files in archives.items():
-                            total_files_uploaded += len(files)
-                            logger.info(
-                                f"  {location}/{archive_type}: {len(files)} files"
-                            )
-
-                    # Track years for parquet processing
-                    start_year = datetime.strptime(chunk_start, "%Y-%m-%d").year
-                    end_year = datetime.strptime(chunk_end, "%Y-%m-%d").year
-                    for year in range(start_year, end_year + 1):
-                        all_years_processed.add(str(year))
-
-            # Update tracking on success
-            update_tracking(chunk_end)
-
-            if chunk_has_data:
-                logger.info(f"Chunk complete with data: {chunk_start} to {chunk_end}")
-            else:
-                logger.info(
-                    f"Chunk empty (no data): {chunk_start} to {chunk_end}, moving to next..."
-                )
-
-        except KeyboardInterrupt:
-            logger.info("Interrupted by user")
-            break
-        except Exception as e:
-            logger.error(f"Error processing chunk: {e}")
-            import traceback
-
-            traceback.print_exc()
-            break
+    try:
+        while True:
+            # Check for timeout
+            if graceful_exit.check_timeout():
+                logger.info("Timeout reached, stopping...")
+                break
+
+            # Get next chunk to process
+            chunk = get_next_chunk(start_date, end_date)
+            if chunk is None:
+                logger.info("Historical backfill complete!")
+                break
+
+            # Only use provided dates for first chunk
+            start_date = None
+            end_date = None
+
+            chunk_start, chunk_end = chunk
+            logger.info(f"Processing chunk: {chunk_start} to {chunk_end}")
+
+            chunk_has_data = False
+
+            try:
+                with S3ArchiveManager(
+                    s3_bucket, s3_prefix, local_dir, immediate_upload=True
+                ) as archive_manager:
+                    # Run the downloader
+                    logger.info(f"Downloading data for {chunk_start} to {chunk_end}...")
+
+                    run(
+                        courts=courts,
+                        start_date=chunk_start,
+                        end_date=chunk_end,
+                        day_step=day_step,
+                        max_workers=max_workers,
+                        download_workers=download_workers,
+                        archive_manager=archive_manager,
+                        compress_pdfs=compress_pdfs,
+                        # Historical months that searched empty stay empty
+                        skip_known_empty=True,
+                    )
+
+                    all_changes = archive_manager.get_all_changes()
+
+                    if all_changes:
+                        chunk_has_data = True
+                        for location, archives in all_changes.items():
+                            for archive_type, files in archives.items():
+                                total_files_uploaded += len(files)
+                                logger.info(
+                                    f"  {location}/{archive_type}: {len(files)} files"
+                                )
+
+                        # Track years for parquet processing
+                        start_year = datetime.strptime(chunk_start, "%Y-%m-%d").year
+                        end_year = datetime.strptime(chunk_end, "%Y-%m-%d").year
+                        for year in range(start_year, end_year + 1):
+                            all_years_processed.add(str(year))
+
+                if graceful_exit.should_exit:
+                    # run() stopped part-way; redo this chunk next time (tasks
+                    # already done are skipped via the completed-task log)
+                    logger.info(f"Chunk interrupted: {chunk_start} to {chunk_end}")
+                    break
+
+                # Update tracking on success
+                update_tracking(chunk_end)
+
+                if chunk_has_data:
+                    logger.info(
+                        f"Chunk complete with data: {chunk_start} to {chunk_end}"
+                    )
+                else:
+                    logger.info(
+                        f"Chunk empty (no data): {chunk_start} to {chunk_end}, moving to next..."
+                    )
+
+            except KeyboardInterrupt:
+                logger.info("Interrupted by user")
+                break
+            except Exception:
+                logger.exception("Error processing chunk")
+                break
+    finally:
+        graceful_exit.disarm()
 
     # Process metadata to parquet for all years that had data
     if all_years_processed:
@@ -249,11 +290,8 @@ def sync_s3_fill_gaps(
                     f"Successfully processed {total_records} records to parquet"
                 )
 
-        except Exception as e:
-            logger.error(f"Error processing metadata to parquet: {e}")
-            import traceback
-
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error processing metadata to parquet")
     else:
         logger.info("No data was uploaded, skipping parquet processing")
 
@@ -0,0 +1,72 @@
+"""
+Check the parties split in parse_order_results against the separator loop it
+replaced. Every case must split as the loop did, unless it is listed below as
+a deliberate change.
+"""
+
+import sys
+
+sys.path.insert(0, ".")
+from download import _split_parties
+
+
+def loop_split(parties: str):
+    """The original split: the first separator kind present wins"""
+    for separator in ["Vs", "VS", "vs", "V/s", "v/s", " v ", " V "]:
+        if separator in parties:
+            parts = parties.split(separator, 1)
+            return parts[0].strip(), parts[1].strip()
+    return None
+
+
+# Cells that split exactly as before
+UNCHANGED = [
+    "RAMESH KUMAR Vs SURESH",
+    "RAMESH KUMARVsSURESH",
+    "RameshVs Suresh",
+    "RameshVsSuresh",
+    "Rameshvs Suresh",
+    "Ravs Shyam",
+    "Ramesh vs Suresh",
+    "RAMESH VS SURESH",
+    "Ramesh V/s Suresh",
+    "Rameshv/s Suresh",
+    "Ramesh v/s Suresh",
+    "Ramesh v Suresh",
+    "RAMESH V SURESH",
+    "Ramesh Vs\nSuresh",
+    "A vs B Vs C",
+    "A V B v C",
+    "VSK Traders Vs Ram",
+    "Devsingh Vs Ram",
+    "RAMESH V/S SURESH",
+    "Ramesh Kumar",
+    "Vs Ram",
+    "",
+]
+
+# (cell, new split, why it differs from the loop)
+CHANGED = [
+    ("State Vs. Ram", ("State", "Ram"), "a dot after the separator is dropped"),
+    ("State vs. Ram", ("State", "Ram"), "a dot after the separator is dropped"),
+    ("Devsingh Kumar", None, "vs inside a word is not a separator"),
+    ("Devsingh vs Ram", ("Devsingh", "Ram"), "vs inside a word is not a separator"),
+]
+
+
+def test_parties_split():
+    for parties in UNCHANGED:
+        assert _split_parties(parties) == loop_split(parties), parties
+    for parties, expected, _ in CHANGED:
+        assert _split_parties(parties) == expected, parties
+        assert loop_split(parties) != expected, parties
+
+
+if __name__ == "__main__":
+    for parties in UNCHANGED:
+        print(f"{parties!r:28} {_split_parties(parties)}")
+    for parties, expected, reason in CHANGED:
+        was = loop_split(parties)
+        print(f"{parties!r:28} {_split_parties(parties)} (was {was}: {reason})")
+    test_parties_split()
+    print("OK")
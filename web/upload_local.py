@@ -78,6 +78,23 @@ def create_index_for_tar(
     return index
 
 
+def list_existing_keys(s3, s3_bucket: str, prefix: str) -> Optional[set]:
+    """
+    List every key under an S3 prefix in one paginated ListObjectsV2 scan.
+    Returns None if listing is not permitted, so callers can fall back to HEAD.
+    """
+    keys = set()
+    try:
+        paginator = s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=s3_bucket, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                keys.add(obj["Key"])
+    except s3.exceptions.ClientError as e:
+        logger.debug(f"Could not list {prefix}, checking keys one by one: {e}")
+        return None
+    return keys
+
+
 def upload_local_files(
     s3_bucket: str,
     s3_prefix: str,
@@ -112,6 +129,8 @@ def upload_local_files(
 
     uploaded_count = 0
     skipped_count = 0
+    # Existing keys per S3 directory, listed once instead of a HEAD per TAR
+    existing_by_dir = {}
 
     for tar_path in tar_files:
         # Parse path: local_dir/year/state/district/complex/archive.tar
@@ -151,17 +170,27 @@ def upload_local_files(
             continue
 
         # S3 key
-        s3_key = f"{s3_prefix}{s3_path_prefix}/year={year}/state={state_code}/district={district_code}/complex={complex_code}/{tar_name}"
+        s3_dir = f"{s3_prefix}{s3_path_prefix}/year={year}/state={state_code}/district={district_code}/complex={complex_code}/"
+        s3_key = f"{s3_dir}{tar_name}"
 
         # Check if already exists in S3
-        try:
-            s3.head_object(Bucket=s3_bucket, Key=s3_key)
-            logger.debug(f"Already exists in S3: {s3_key}")
-            skipped_count += 1
-            continue
-        except s3.exceptions.ClientError as e:
-            if e.response["Error"]["Code"] != "404":
-                raise
+        if s3_dir not in existing_by_dir:
+            existing_by_dir[s3_dir] = list_existing_keys(s3, s3_bucket, s3_dir)
+        existing = existing_by_dir[s3_dir]
+        if existing is not None:
+            if s3_key in existing:
+                logger.debug(f"Already exists in S3: {s3_key}")
+                skipped_count += 1
+                continue
+        else:
+            try:
+                s3.head_object(Bucket=s3_bucket, Key=s3_key)
+                logger.debug(f"Already exists in S3: {s3_key}")
+                skipped_count += 1
+                continue
+            except s3.exceptions.ClientError as e:
+                if e.response["Error"]["Code"] != "404":
+                    raise
 
         tar_size = tar_path.stat().st_size
         logger.info(